@@ -1,18 +1,18 @@
 """HomeChum EV Charging Tracker integration."""
 import logging
-import datetime
 import os
+import queue
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.storage import Store
 from homeassistant.components.persistent_notification import create as notify_create
 from homeassistant.helpers.discovery import async_load_platform
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 # Define log directory
 log_dir = "/config/custom_components/homechum_ev_charging_tracker/logs"
-os.makedirs(log_dir, exist_ok=True)  # Ensure the log directory exists
 
 # Define log file path
 log_file = os.path.join(log_dir, "homechum_ev_debug.log")
@@ -21,16 +21,22 @@ log_file = os.path.join(log_dir, "homechum_ev_debug.log")
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.DEBUG)
 
-# Configure timed rotating file handler (rollover every 1 day, keep last 2 day of logs)
-file_handler = TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=2, encoding="utf-8")
-file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+# Queue records and let a background thread write them, so debug logging never blocks the event loop.
+# Records logged before async_setup wait in the queue until the file writer is started.
+log_queue = queue.SimpleQueue()
 
 # Add handler to logger
-_LOGGER.addHandler(file_handler)
+_LOGGER.addHandler(QueueHandler(log_queue))
 
-def setup(hass, config):
-    _LOGGER.info("HOMECHUM: Initializing HomeChum EV Charging Tracker Component")
-    return True
+def _create_file_handler() -> TimedRotatingFileHandler:
+    """Create the log directory and rotating file handler; does blocking IO, so runs in the executor."""
+    os.makedirs(log_dir, exist_ok=True)  # Ensure the log directory exists
+
+    # Configure timed rotating file handler (rollover every 1 day, keep last 2 day of logs)
+    # delay=True postpones opening the file until the first record is written
+    file_handler = TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=2, encoding="utf-8", delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    return file_handler
 
 DOMAIN = "homechum_ev_charging_tracker"
 STORAGE_KEY = "homechum_ev_charging_tracker.public_sessions"
@@ -39,6 +45,16 @@ STORAGE_VERSION = 1
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HomeChum EV Charging Tracker integration."""
     
+    file_handler = await hass.async_add_executor_job(_create_file_handler)
+    log_listener = QueueListener(log_queue, file_handler)
+    log_listener.start()
+
+    async def async_stop_log_listener(event: Event) -> None:
+        """Flush queued log records and stop the writer thread on shutdown."""
+        await hass.async_add_executor_job(log_listener.stop)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_stop_log_listener)
+
     _LOGGER.debug("HOMECHUM: Initializing HomeChum EV Charging Tracker integration...")
     # 🔹 Ensure Home Assistant loads the sensor and binary_sensor platforms
     _LOGGER.debug("HOMECHUM: Loading sensor and binary sensor platforms...")
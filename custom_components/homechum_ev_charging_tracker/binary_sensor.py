@@ -1,11 +1,18 @@
 """Binary sensor platform for HomeChum EV Charging Tracker."""
 import logging
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
 DOMAIN = "homechum_ev_charging_tracker"
 
+# Entities that decide whether the car is charging away from home
+CHARGING_ENTITY = "switch.myida_charging"
+POSITION_ENTITY = "device_tracker.myida_position"
+CHARGER_STATUS_ENTITY = "sensor.ohme_epod_status"
+
+TRACKED_ENTITIES = [CHARGING_ENTITY, POSITION_ENTITY, CHARGER_STATUS_ENTITY]
+
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -15,54 +22,78 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     sensor = PublicChargingDetectedSensor(hass)
     async_add_entities([sensor])
 
-    _LOGGER.debug(f"HOMECHUM: Sensor added: {sensor}")
-
-    # Track state changes for relevant entities
-    async_track_state_change_event(
-        hass,
-        [
-            "switch.myida_charging",
-            "device_tracker.myida_position",
-            "sensor.ohme_epod_status"
-        ],
-        sensor.async_update_state
-    )
-
-    # Force an initial state update
-    await sensor.async_update_state(None)
-    _LOGGER.debug("HOMECHUM: Initial state update triggered")
+    _LOGGER.debug("HOMECHUM: Sensor added: %s", sensor)
 
 
 class PublicChargingDetectedSensor(BinarySensorEntity):
     """Binary sensor: Public Charging Detected."""
 
+    # Fixed per class, so kept off the instance
+    _attr_name = "EV Public Charging Detected"
+    _attr_unique_id = "ev_public_charge_detected"
+    _attr_should_poll = False  # State is pushed from the tracked entities
+
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Public Charging Detected"
-        self._attr_unique_id = "ev_public_charge_detected"
         self._attr_is_on = False  # Default state is False
 
+        # Last known state object of every tracked entity, kept up to date from events
+        self._input_states = {}
+
+    async def async_added_to_hass(self):
+        """Subscribe to the tracked entities and compute the initial state."""
+        await super().async_added_to_hass()
+
+        # One listener covers all tracked entities; released when the entity is removed
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, TRACKED_ENTITIES, self.async_update_state
+            )
+        )
+
+        # The entity is registered now, so the initial state can be written
+        self.async_update_state(None)
+        _LOGGER.debug("PupChrgDetct: Initial state update triggered")
+
     @property
     def is_on(self):
         """Return True if public charging is detected."""
         return self._attr_is_on
 
-    async def async_update_state(self, event):
+    @callback
+    def async_update_state(self, event):
         """Update state when a tracked entity changes."""
-        entity_id = event.data["entity_id"] if event else "initial_update"
+        if event:
+            old_state = event.data.get("old_state")
+            new_state = event.data.get("new_state")
+            if old_state and new_state and old_state.state == new_state.state:
+                # Attribute-only update; the inputs we compare on did not change
+                return
 
-        charging_state = self.hass.states.get("switch.myida_charging")
-        location_state = self.hass.states.get("device_tracker.myida_position")
-        ohme_status = self.hass.states.get("sensor.ohme_epod_status")
+            # Only the entity that fired has changed; take its state straight from the event
+            self._input_states[event.data["entity_id"]] = new_state
+        else:
+            for entity_id in TRACKED_ENTITIES:
+                self._input_states[entity_id] = self.hass.states.get(entity_id)
+
+        charging_state = self._input_states.get(CHARGING_ENTITY)
+        location_state = self._input_states.get(POSITION_ENTITY)
+        ohme_status = self._input_states.get(CHARGER_STATUS_ENTITY)
 
         if not charging_state or not location_state or not ohme_status:
-            self._attr_is_on = False
+            new_value = False
         else:
-            self._attr_is_on = (
+            new_value = (
                 charging_state.state == "on"
                 and location_state.state != "home"
                 and ohme_status.state == "unplugged"
             )
 
-        _LOGGER.debug(f"PupChrgDetct: Sensor new state: {self._attr_is_on}")
-        self.async_write_ha_state()
\ No newline at end of file
+        if new_value == self._attr_is_on:
+            # Nothing changed; skip the state write and the state_changed fan-out
+            return
+
+        self._attr_is_on = new_value
+        _LOGGER.debug("PupChrgDetct: Sensor new state: %s", self._attr_is_on)
+        self.async_write_ha_state()
+
@@ -3,10 +3,11 @@ import logging
 import asyncio
 from homeassistant.helpers.entity import Entity
 from typing import Optional
-from datetime import datetime
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.restore_state import RestoreEntity, RestoredExtraData
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.event import (
     async_call_later,
     async_track_state_change_event,
@@ -14,26 +15,135 @@ from homeassistant.helpers.event import (
 
 DOMAIN = "homechum_ev_charging_tracker"
 
+# Car and charger entities read by the sensors
+CABLE_CONNECTED_ENTITY = "binary_sensor.myida_charging_cable_connected"
+CHARGING_ENTITY = "switch.myida_charging"
+CHARGING_POWER_ENTITY = "sensor.myida_charging_power"
+BATTERY_LEVEL_ENTITY = "sensor.myida_battery_level"
+ODOMETER_ENTITY = "sensor.myida_odometer"
+VEHICLE_MOVING_ENTITY = "binary_sensor.myida_vehicle_moving"
+PUBLIC_CHARGE_DETECTED_ENTITY = "binary_sensor.ev_public_charge_detected"
+CHARGE_MODE_ENTITY = "select.ohme_epod_charge_mode"
+ELECTRICITY_RATE_ENTITY = "sensor.octopus_electricity_current_rate"
+
+# Sensors of this integration that other sensors read
+HOME_ENERGY_PER_CHARGE_ENTITY = "sensor.ev_home_energy_per_charge"
+HOME_CHARGE_SESSION_COST_ENTITY = "sensor.ev_home_charge_session_cost"
+HOME_CHARGING_SAVINGS_ENTITY = "sensor.ev_home_charging_savings_per_session"
+TOTAL_HOME_ENERGY_ENTITY = "sensor.total_ev_home_energy"
+PUBLIC_ENERGY_PER_CHARGE_ENTITY = "sensor.ev_public_energy_per_charge"
+PUBLIC_CHARGE_COST_PER_SESSION_ENTITY = "sensor.ev_public_charge_cost_per_session"
+
+# Input number helpers holding reference values and user input
+C2C_START_MILE_ENTITY = "input_number.myida_c2c_start_mile"
+C2C_START_SOC_ENTITY = "input_number.myida_c2c_start_soc"
+C2C_START_KWH_ENTITY = "input_number.myida_c2c_start_kwh"
+PUBLIC_CHARGE_COST_PER_KWH_ENTITY = "input_number.ev_public_charge_cost_per_kwh"
+
+# States that carry no usable value
+INVALID_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE, None))
+
+# Ohme charge modes (select.ohme_epod_charge_mode) that determine the home tariff
+CHARGE_MODE_SMART = "smart_charge"
+CHARGE_MODE_MAX = "max_charge"
+
+# Fixed home tariff applied while the Ohme charger is in smart charge mode
+SMART_CHARGE_RATE_GBP_PER_KWH = 0.07
+
+# Usable battery capacity (kWh) assumed when estimating energy from a SoC drop
+BATTERY_CAPACITY_KWH = 77.0
+
+# SoC and odometer are compared as integer steps of their reported resolution,
+# 0.1 % and 0.01 mi, so a real one-step move is never lost to float rounding
+SOC_STEPS_PER_PERCENT = 10
+ODOMETER_STEPS_PER_MILE = 100
+
+# Moves of fewer than these many steps, up or down, are sensor jitter: a one-step
+# wobble (50.0 → 50.1 → 50.0 %) leaves the baseline alone, while a slow drift
+# still counts once it is two steps away from the baseline
+SOC_EPS = 2
+MILES_EPS = 2
+
+# Plug-in phases of a charging session, switched by the cable connected entity
+PHASE_IDLE = "idle"
+PHASE_ACTIVE = "active"
+
 # Delay to calculate drive to drive efficiency in sec
 DEBOUNCE_DELAY_SECONDS = 60
 
+# Push notification sent when a public charging session ends
+PUBLIC_CHARGE_NOTIFY_MESSAGE = (
+    "Public Charging Session Ended 🚗⚡\n"
+    "Energy Used: {session_energy:.2f} kWh\n"
+    "Please enter the cost per kWh in the Home Assistant app."
+)
+
 _LOGGER = logging.getLogger(__name__)
 
-async def async_setup(hass, config):
-    """Set up the component via configuration.yaml."""
-    hass.helpers.discovery.load_platform("sensor", DOMAIN, {}, config)
-    return True
+def get_state(hass: HomeAssistant, entity_id: str, event=None):
+    """Return the state object of an entity, taken from the event if it is the one that changed."""
+    if event is not None and event.data["entity_id"] == entity_id:
+        return event.data["new_state"]
+    return hass.states.get(entity_id)
 
-def get_float_state(hass: HomeAssistant, entity_id: str) -> float | None:
+def state_unchanged(event) -> bool:
+    """Return True for attribute-only updates, where the state itself did not change."""
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    return old_state is not None and new_state is not None and old_state.state == new_state.state
+
+def get_float_state(hass: HomeAssistant, entity_id: str, event=None) -> float | None:
     """Utility to safely get a float state from an entity."""
-    state_obj = hass.states.get(entity_id)
-    if state_obj and state_obj.state not in ("unknown", "unavailable", None):
+    state_obj = get_state(hass, entity_id, event)
+    if state_obj and state_obj.state not in INVALID_STATES:
         try:
             return float(state_obj.state)
         except ValueError:
             return None
     return None
 
+def get_input_number_state(hass: HomeAssistant, entity_id: str) -> float | None:
+    """Retrieve a float value from an input_number entity, warning if it holds garbage."""
+    state = hass.states.get(entity_id)
+    if state and state.state not in INVALID_STATES:
+        try:
+            return float(state.state)
+        except ValueError:
+            _LOGGER.warning("Invalid value stored in %s: %s", entity_id, state.state)
+    return None
+
+def soc_steps(soc: float) -> int:
+    """SoC (%) quantised to its 0.1 % resolution."""
+    return round(soc * SOC_STEPS_PER_PERCENT)
+
+def odometer_steps(miles: float) -> int:
+    """Odometer (mi) quantised to its 0.01 mi resolution."""
+    return round(miles * ODOMETER_STEPS_PER_MILE)
+
+def held_power_kwh(last_ts, last_power: float, ts) -> float:
+    """Energy (kWh) drawn between two power samples, holding the earlier sample (kW) until the next.
+
+    The charging power only reports when it changes, so it is a step signal: the left
+    (zero-order hold) rule is exact for it, where the trapezoid rule would ramp every step.
+    """
+    hours = (ts - last_ts).total_seconds() / 3600
+    return last_power * hours
+
+def soc_drop_kwh(last_soc: float, soc_now: float, capacity_kwh: float = BATTERY_CAPACITY_KWH) -> float | None:
+    """Estimate the energy (kWh) used from a SoC drop; None if the SoC did not drop."""
+    soc_drop = last_soc - soc_now
+    if soc_drop <= 0:
+        return None
+    return (soc_drop / 100) * capacity_kwh
+
+def get_home_charge_rate(hass: HomeAssistant, charge_mode: str) -> float | None:
+    """Return the home charging rate (GBP/kWh) for an Ohme charge mode."""
+    if charge_mode == CHARGE_MODE_SMART:
+        return SMART_CHARGE_RATE_GBP_PER_KWH
+    if charge_mode == CHARGE_MODE_MAX:
+        return get_float_state(hass, ELECTRICITY_RATE_ENTITY)
+    return None
+
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up sensor entities from a config entry."""
     _LOGGER.info("HOMECHUM: Initializing EV Charging Tracker sensors")
@@ -56,18 +166,113 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         # TotalPublicChargingCostSensor(hass),
         # DriveToDriveMilesPerKWhSensor(hass)
     ]
-    async_add_entities(sensors, update_before_add=True)
+    async_add_entities(sensors)
+
+class _TrackedInputsMixin:
+    """Subscribe to TRACKED_ENTITIES, recompute with _update_state(event), and write the state only when it changed."""
+    _attr_should_poll = False  # State is pushed from state-change events
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES: frozenset[str] = frozenset()
+
+    # Set when an input's attributes carry data, so attribute-only updates are not skipped
+    TRACK_ATTRIBUTE_UPDATES = False
+
+    def _update_state(self, event=None) -> None:
+        """Recompute the state from the inputs; event is None for the initial evaluation."""
+
+    def _async_track_inputs(self) -> None:
+        """Subscribe to TRACKED_ENTITIES and pick up the current inputs before the first state write."""
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                self.TRACKED_ENTITIES,
+                self.async_update_callback
+            )
+        )
+        self._update_state()
+
+    @callback
+    def async_update_callback(self, event):
+        """Recompute on a tracked state change and push the new state if it changed."""
+        if not self.TRACK_ATTRIBUTE_UPDATES and state_unchanged(event):
+            return  # Attribute-only update; nothing to recompute
+        old_state_obj = event.data.get("old_state")
+        new_state_obj = event.data.get("new_state")
+        _LOGGER.debug(
+            "%s: State change event for %s: %s → %s",
+            self.entity_id,
+            event.data.get("entity_id"),
+            old_state_obj.state if old_state_obj else None,
+            new_state_obj.state if new_state_obj else None,
+        )
+        self._async_refresh(event)
+
+    @callback
+    def _async_refresh(self, event=None):
+        """Recompute with _update_state and write the state only if the value or attributes moved."""
+        previous = (self._attr_native_value, getattr(self, "_attr_extra_state_attributes", None))
+        self._update_state(event)
+        if (self._attr_native_value, getattr(self, "_attr_extra_state_attributes", None)) == previous:
+            # Nothing changed; skip the state write and the state_changed fan-out
+            return
+        self.async_write_ha_state()
+
+class FloatRestoreEntity(RestoreEntity):
+    """RestoreEntity whose numeric state is put back into _attr_native_value after a restart."""
+
+    async def async_restore_native_value(self) -> State | None:
+        """Restore _attr_native_value from the last saved state; return that state if it was usable."""
+        last_state = await self.async_get_last_state()
+        if last_state is None or last_state.state in INVALID_STATES:
+            return None
+        try:
+            self._attr_native_value = float(last_state.state)
+        except ValueError:
+            _LOGGER.warning("%s: Stored state was invalid float: %s", self.entity_id, last_state.state)
+            return None
+        _LOGGER.debug("%s: Restored state: %s", self.entity_id, self._attr_native_value)
+        return last_state
 
-class ChargeToChargeEfficiencySensor(SensorEntity, RestoreEntity):
+class BaselineRestoreEntity(FloatRestoreEntity):
+    """RestoreEntity that also keeps the reference values named in BASELINE_ATTRS across restarts."""
+
+    BASELINE_ATTRS: tuple[str, ...] = ()
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData:
+        """Reference values saved alongside the state."""
+        return RestoredExtraData({name: getattr(self, name) for name in self.BASELINE_ATTRS})
+
+    async def async_restore_baselines(self) -> None:
+        """Put back the reference values saved before the restart, if any."""
+        last_extra_data = await self.async_get_last_extra_data()
+        if last_extra_data is None:
+            return
+        stored = last_extra_data.as_dict()
+        for name in self.BASELINE_ATTRS:
+            if name in stored:
+                setattr(self, name, stored[name])
+
+class ChargeToChargeEfficiencySensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to track efficiency from charge to charge, restoring state on restart."""
+    _attr_name = "EV Charge to Charge Efficiency"
+    _attr_unique_id = "ev_charge_to_charge_efficiency"
+    _attr_native_unit_of_measurement = "mi/%"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        CABLE_CONNECTED_ENTITY,
+        CHARGING_ENTITY,
+    })
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("was_charging",)
 
     def __init__(self, hass: HomeAssistant):
         """Initialize the efficiency sensor."""
         self.hass = hass
-        self._attr_name = "EV Charge to Charge Efficiency"
-        self._attr_unique_id = "ev_charge_to_charge_efficiency"
-        self._attr_native_unit_of_measurement = "mi/%"
-        self._attr_state: float = 0.0 # Start tracking from zero
+        self._attr_native_value: float = 0.0 # Start tracking from zero
 
         self.last_miles: float = 0.0
         self.last_soc: float = 0.0
@@ -75,163 +280,131 @@ class ChargeToChargeEfficiencySensor(SensorEntity, RestoreEntity):
 
         _LOGGER.info("C2C Effcny: Initializing ChargeToChargeEfficiencySensor")
 
-    def get_input_number_state(self, entity_id: str) -> float | None:
-        """Retrieve a float value from an input_number entity in Home Assistant."""
-        state = self.hass.states.get(entity_id)
-        if state and state.state not in (None, "unknown", "unavailable"):
-            try:
-                return float(state.state)
-            except ValueError:
-                _LOGGER.warning("Invalid value stored in %s: %s", entity_id, state.state)
-        return None
-        
     async def async_added_to_hass(self):
         """Restore the last known efficiency value after a restart."""
         await super().async_added_to_hass()
 
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-                _LOGGER.info("C2C Effcny: Restored efficiency state: %s", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("C2C Effcny: Stored state was invalid float: %s", last_state.state)
+        await self.async_restore_native_value()
 
         _LOGGER.debug("C2C Effcny: Restoring stored last_miles and last_soc from input_numbers.")
-        # self.last_miles = self.get_input_number_state("input_number.myida_c2c_start_mile") or 0.0
-        # self.last_soc = self.get_input_number_state("input_number.myida_c2c_start_soc") or 0.0
-
-        _LOGGER.debug("C2C Effcny: Subscribe to state changes for: %s", [
-            "binary_sensor.myida_charging_cable_connected",
-            "switch.myida_charging",
-        ])
-        # Subscribe to state changes using async_track_state_change_event.
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            ["binary_sensor.myida_charging_cable_connected", "switch.myida_charging"],
-            self.async_update_callback
-        )
+        # self.last_miles = get_input_number_state(self.hass, "input_number.myida_c2c_start_mile") or 0.0
+        # self.last_soc = get_input_number_state(self.hass, "input_number.myida_c2c_start_soc") or 0.0
+
+        await self.async_restore_baselines()
+
+        _LOGGER.debug("C2C Effcny: Subscribe to state changes for: %s", sorted(self.TRACKED_ENTITIES))
+        self._async_track_inputs()
 
     async def store_initial_values(self):
         """Store initial miles and SoC in Home Assistant input_number entities when charging starts."""
-        miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-        soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY)
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY)
 
         if miles_now is not None and soc_now is not None:
             await self.hass.services.async_call(
                 "input_number", "set_value",
-                {"entity_id": "input_number.myida_c2c_start_mile", "value": miles_now},
+                {"entity_id": C2C_START_MILE_ENTITY, "value": miles_now},
                 blocking=True
             )
             await self.hass.services.async_call(
                 "input_number", "set_value",
-                {"entity_id": "input_number.myida_c2c_start_soc", "value": soc_now},
+                {"entity_id": C2C_START_SOC_ENTITY, "value": soc_now},
                 blocking=True
             )
             _LOGGER.info("C2C Effcny: Stored initial values: last_miles=%s, last_soc=%s", miles_now, soc_now)
         else:
             _LOGGER.warning("C2C Effcny: Cannot store initial values: Odometer or battery level sensor unavailable.")
-        
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-
-    async def async_update_callback(self, event):
-        """Triggered whenever the cable sensor or charging switch changes."""
-        entity_id = event.data.get("entity_id")
-        old_state_obj = event.data.get("old_state")
-        new_state_obj = event.data.get("new_state")
-
-        old_state = old_state_obj.state if old_state_obj else None
-        new_state = new_state_obj.state if new_state_obj else None
 
-        _LOGGER.debug(
-            "C2C Effcny:: State change event for %s: %s → %s. Forcing sensor refresh.",
-            entity_id, old_state, new_state
-        )
-        # Force an immediate update of our sensor
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
-        """Calculate and return the charge-to-charge efficiency."""
-        cable_state = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        charging_state = self.hass.states.get("switch.myida_charging")
+    def _update_state(self, event=None):
+        """Recalculate the charge-to-charge efficiency."""
+        cable_state = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        charging_state = get_state(self.hass, CHARGING_ENTITY, event)
 
         if cable_state is None or charging_state is None:
             # Entities unavailable; keep the last known efficiency.
-            _LOGGER.debug("C2C Effcny: Input signals not available: %s", self._attr_state)
-            return self._attr_state
+            _LOGGER.debug("C2C Effcny: Input signals not available: %s", self._attr_native_value)
+            return
 
         cable_connected = (cable_state.state == "on")
         charging = (charging_state.state == "on")
 
-        if cable_connected and charging:
-            # Charging started: Mark this session as "charging detected"
-            _LOGGER.debug("C2C Effcny: status of was_charging when EV charging started: %s", self.was_charging)
-            if not self.was_charging:
-                _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started")
-                miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-                _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started miles_now: %s", miles_now)
-                soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
-                _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started Soc now: %s", soc_now)
-                last_miles = self.get_input_number_state("input_number.myida_c2c_start_mile")
-                _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started last miles: %s", last_miles)
-                last_soc = self.get_input_number_state("input_number.myida_c2c_start_soc")
-                _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started last soc: %s", last_soc)
-
-                if None in (miles_now, soc_now, last_miles, last_soc):
-                    _LOGGER.warning("C2C Effcny: Cannot calculate efficiency: Missing stored or current values.")
-                    return self._attr_state
+        # Only the two session edges do any work; every other combination keeps the last value
+        handler = self._TRANSITIONS.get((cable_connected, charging, self.was_charging))
+        if handler is not None:
+            handler(self, event)
+
+    def _on_charge_start(self, event):
+        """Charging started: calculate the efficiency of the cycle that just ended."""
+        _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started")
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
+        _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started miles_now: %s", miles_now)
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY, event)
+        _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started Soc now: %s", soc_now)
+        last_miles = get_input_number_state(self.hass, C2C_START_MILE_ENTITY)
+        _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started last miles: %s", last_miles)
+        last_soc = get_input_number_state(self.hass, C2C_START_SOC_ENTITY)
+        _LOGGER.debug("C2C Effcny: C2C Efficiency calcualtion started last soc: %s", last_soc)
+
+        if None in (miles_now, soc_now, last_miles, last_soc):
+            _LOGGER.warning("C2C Effcny: Cannot calculate efficiency: Missing stored or current values.")
+            return
 
-                miles_travelled = miles_now - last_miles
-                soc_used = last_soc - soc_now
+        miles_travelled = miles_now - last_miles
+        soc_used = last_soc - soc_now
 
-                if miles_travelled <= 0.1:  # Ensure the car actually moved
-                    _LOGGER.warning("C2C Effcny: Drive cycle not detected (miles_travelled=%s). Skipping efficiency update.", miles_travelled)
-                    return self._attr_state  # Prevent invalid calculations
+        if miles_travelled <= 0.1:  # Ensure the car actually moved
+            _LOGGER.warning("C2C Effcny: Drive cycle not detected (miles_travelled=%s). Skipping efficiency update.", miles_travelled)
+            return  # Prevent invalid calculations
 
-                if soc_used > 0:
-                    self._attr_state = round(miles_travelled / soc_used, 2)
-                    _LOGGER.info("C2C Effcny: Updated efficiency: %s mi/%% (miles=%s, soc_used=%s)", self._attr_state, miles_travelled, soc_used)
+        if soc_used > 0:
+            self._attr_native_value = round(miles_travelled / soc_used, 2)
+            _LOGGER.info("C2C Effcny: Updated efficiency: %s mi/%% (miles=%s, soc_used=%s)", self._attr_native_value, miles_travelled, soc_used)
 
-                self.was_charging = True
-                return self._attr_state  # Updated efficiency value
-            return self._attr_state #Preserve previous value
+        # Charging started: Mark this session as "charging detected"
+        self.was_charging = True
 
-        if not charging and not cable_connected and self.was_charging:
-            # Cable unplugged after a successful charge → Calculate efficiency
-            miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-            soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
-            _LOGGER.debug("C2C Effcny: status of was_charging when EV charging finished: %s", self.was_charging)
+    def _on_session_end(self, event):
+        """Cable unplugged after a successful charge: store the start values of the next cycle."""
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY, event)
+        _LOGGER.debug("C2C Effcny: status of was_charging when EV charging finished: %s", self.was_charging)
 
-            # Store new values for the next charge cycle
-            self.hass.async_create_task(self.store_initial_values())
-            _LOGGER.info("C2C Effcny: One charging cycle complete and stored the current miles: %s and SoC: %s for next cycle", miles_now, soc_now)
+        # Store new values for the next charge cycle
+        self.hass.async_create_task(self.store_initial_values(), eager_start=True)
+        _LOGGER.info("C2C Effcny: One charging cycle complete and stored the current miles: %s and SoC: %s for next cycle", miles_now, soc_now)
 
-            if miles_now is None or soc_now is None:
-                _LOGGER.warning("C2C Effcny: Odometer or battery level sensor unavailable.")
-                return self._attr_state
-            _LOGGER.debug("C2C Effcny: Charging session complete and start miles recorded as = %s mi", miles_now)
-            _LOGGER.debug("C2C Effcny: Charging session complete and start SoC recorded as = %s mi", soc_now)
+        if miles_now is None or soc_now is None:
+            _LOGGER.warning("C2C Effcny: Odometer or battery level sensor unavailable.")
+            return
+        _LOGGER.debug("C2C Effcny: Charging session complete and start miles recorded as = %s mi", miles_now)
+        _LOGGER.debug("C2C Effcny: Charging session complete and start SoC recorded as = %s mi", soc_now)
 
-            # Reset charging flag since charging session is complete
-            self.was_charging = False
-            return self._attr_state  # Keep updated efficiency value
-            
-        return self._attr_state  # Keep last efficiency value until next valid charge cycle
+        # Reset charging flag since charging session is complete
+        self.was_charging = False
+
+    # (cable connected, charging, was_charging) -> handler for the session edges
+    _TRANSITIONS = {
+        (True, True, False): _on_charge_start,
+        (False, False, True): _on_session_end,
+    }
 
-class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
+class DriveToDriveEfficiencySensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to track drive-to-drive efficiency with a debounce to avoid quick stops."""
+    _attr_name = "EV Drive to Drive Efficiency"
+    _attr_unique_id = "ev_drive_to_drive_efficiency"
+    _attr_native_unit_of_measurement = "mi/%"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        VEHICLE_MOVING_ENTITY,
+    })
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("start_miles", "start_soc")
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Drive to Drive Efficiency"
-        self._attr_unique_id = "ev_drive_to_drive_efficiency"
-        self._attr_native_unit_of_measurement = "mi/%"
-        self._attr_state: Optional[float] = 0.0
+        self._attr_native_value: Optional[float] = 0.0
 
         # Track start conditions for each drive session
         self.start_miles: Optional[float] = None
@@ -242,32 +415,23 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
 
         _LOGGER.debug("D2DEffcny: DriveToDriveEfficiencySensor initialized.")
 
-        # Listen for changes in the car’s “moving” state
-        async_track_state_change_event(
-            hass,
-            ["binary_sensor.myida_vehicle_moving"],
-            self.async_update_callback
-        )
-
     async def async_added_to_hass(self):
         """Restore last known state on restart."""
         _LOGGER.info("D2DEffcny: DriveToDriveEfficiencySensor added to Home Assistant.")
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in ("unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-                _LOGGER.debug("D2DEffcny: Restored drive-to-drive efficiency to %s", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("D2DEffcny: Stored state was invalid float: %s", last_state.state)
-                self._attr_state = 0.0
-
-    async def async_update_callback(self, event):
+        await self.async_restore_native_value()
+
+        await self.async_restore_baselines()
+
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
         """
         Called when binary_sensor.myida_vehicle_moving changes.
         event.data includes entity_id, old_state, new_state, etc.
         """
-        entity_id = event.data.get("entity_id")
+        if event is None:
+            return  # Drives are only measured from a movement edge
         old_state_obj = event.data.get("old_state")
         new_state_obj = event.data.get("new_state")
 
@@ -275,12 +439,6 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
             return  # Unclear or missing new state
 
         moving = (new_state_obj.state == "on")
-        _LOGGER.debug(
-            "D2DEffcny: Movement state changed for %s: %s -> %s",
-            entity_id,
-            old_state_obj.state if old_state_obj else "unknown",
-            new_state_obj.state
-        )
 
         if moving:
             # Car just started moving again
@@ -292,15 +450,15 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
 
             # If we don't yet have a "start" condition, record it now
             if self.start_miles is None or self.start_soc is None:
-                self.start_miles = get_float_state(self.hass, "sensor.myida_odometer")
-                self.start_soc = get_float_state(self.hass, "sensor.myida_battery_level")
+                self.start_miles = get_float_state(self.hass, ODOMETER_ENTITY)
+                self.start_soc = get_float_state(self.hass, BATTERY_LEVEL_ENTITY)
                 _LOGGER.debug(
                     "D2DEffcny: Drive session started: miles=%.2f, soc=%.2f",
                     self.start_miles or 0,
                     self.start_soc or 0
                 )
 
-        else:
+        elif old_state_obj and old_state_obj.state == "on":
             # Car just stopped; schedule finalization
             _LOGGER.debug(
                 "D2DEffcny: Car stopped; scheduling finalization in %s seconds.",
@@ -313,8 +471,11 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
                     self._finalize_stop
                 )
 
-        # Force sensor state refresh
-        self.async_schedule_update_ha_state()
+    async def async_will_remove_from_hass(self):
+        """Cancel a pending stop finalization."""
+        if self._stop_debounce_task:
+            self._stop_debounce_task()
+            self._stop_debounce_task = None
 
     @callback
     def _finalize_stop(self, _now):
@@ -324,17 +485,18 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
         we only get here if it truly stayed stopped.
         """
         self._stop_debounce_task = None
+        previous = self._attr_native_value
 
         # Check if car is still stopped
-        moving_state = self.hass.states.get("binary_sensor.myida_vehicle_moving")
+        moving_state = self.hass.states.get(VEHICLE_MOVING_ENTITY)
         if not moving_state or moving_state.state == "on":
             # Car restarted moving before grace time ended; do nothing
             _LOGGER.debug("D2DEffcny: Stop finalization called, but car already moving again.")
             return
 
         # Now we finalize the drive session
-        miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-        soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY)
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY)
 
         _LOGGER.debug(
             "D2DEffcny: Finalizing stop. Start miles=%s, start soc=%s, current miles=%s, current soc=%s",
@@ -354,8 +516,8 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
             soc_used = self.start_soc - soc_now
             miles_travelled = miles_now - self.start_miles
             if soc_used > 0:
-                self._attr_state = round(miles_travelled / soc_used, 2)
-                _LOGGER.info("D2DEffcny: Calculated new drive efficiency: %s mi/%%", self._attr_state)
+                self._attr_native_value = round(miles_travelled / soc_used, 2)
+                _LOGGER.info("D2DEffcny: Calculated new drive efficiency: %s mi/%%", self._attr_native_value)
         else:
             _LOGGER.debug("D2DEffcny: No valid usage/distance found, skipping update.")
 
@@ -363,401 +525,419 @@ class DriveToDriveEfficiencySensor(SensorEntity, RestoreEntity):
         self.start_miles = None
         self.start_soc = None
 
-        # Force an update to reflect final efficiency
-        self.async_schedule_update_ha_state()
-
-    @property
-    def state(self) -> Optional[float]:
-        """Return the most recent drive-to-drive efficiency."""
-        return self._attr_state
+        if self._attr_native_value == previous:
+            # Nothing changed; skip the state write and the state_changed fan-out
+            return
+        self.async_write_ha_state()
 
-class ContinuousEfficiencySensor(SensorEntity, RestoreEntity):
+class ContinuousEfficiencySensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to track real-time efficiency (Miles per 1% SoC) continuously, only when SoC decreases."""
+    _attr_name = "EV Continuous Efficiency"
+    _attr_unique_id = "ev_continuous_efficiency"
+    _attr_native_unit_of_measurement = "mi/%"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        BATTERY_LEVEL_ENTITY,
+        CHARGING_ENTITY,
+    })
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("last_miles", "last_soc")
+
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Continuous Efficiency"
-        self._attr_unique_id = "ev_continuous_efficiency"
-        self._attr_native_unit_of_measurement = "mi/%"
-        self._attr_state = None
+        self._attr_native_value = None
 
         self.last_miles = None
         self.last_soc = None
         self.is_charging = False
         self.idle_energy_loss_detected = False
-
-        # Subscribe to changes in battery level and charging state
-        async_track_state_change_event(
-            hass,
-            ["sensor.myida_battery_level", "switch.myida_charging"],
-            self.async_update_callback
-        )
+        self._charging = None  # Charging switch state, refreshed only when the switch fires; None until known
 
     async def async_added_to_hass(self):
         """Restore the last known efficiency value after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-            except ValueError:
-                _LOGGER.warning("CEffcny: Stored state was invalid float: %s", last_state.state)
-                self._attr_state = None
-
-    async def async_update_callback(self, event):
-        """Triggered when the battery level or charging switch changes. """
-        entity_id = event.data.get("entity_id")
-        _LOGGER.debug("CEffcny: State change event from %s. Scheduling efficiency update.", entity_id)
+        await self.async_restore_native_value()
 
-        # Force the sensor state to recalc
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self.async_restore_baselines()
 
-    @property
-    def state(self):
-        """Calculate or return the last-known continuous efficiency (mi/%)."""
-        miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-        soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
-        charging_state = self.hass.states.get("switch.myida_charging")
+        self._async_track_inputs()
 
-        if miles_now is None or soc_now is None or charging_state is None:
-            return self._attr_state  # Keep last known value if data is missing
+    def _update_state(self, event=None):
+        """Recalculate the continuous efficiency (mi/%)."""
+        if event is None or event.data["entity_id"] == CHARGING_ENTITY:
+            charging_state = get_state(self.hass, CHARGING_ENTITY, event)
+            if charging_state is None or charging_state.state in INVALID_STATES:
+                self._charging = None
+                return  # Keep last known value if data is missing
+            self._charging = charging_state.state == "on"
 
-        charging = (charging_state.state == "on")
+        if self._charging is None:
+            return  # Switch state unknown; don't move the baselines until it reports
 
-        if charging:
+        if self._charging:
             # If we are charging, just preserve current efficiency and note that we're charging.
+            # SoC ticks during a session stop here without reading the odometer or battery.
             self.is_charging = True
-            return self._attr_state
+            return
+
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY, event)
+
+        if miles_now is None or soc_now is None:
+            return  # Keep last known value if data is missing
 
         # If we haven't recorded a baseline yet, record the current values.
         if self.last_soc is None or self.last_miles is None:
             self.last_miles = miles_now
             self.last_soc = soc_now
-            return self._attr_state
+            return
+
+        soc_used_steps = soc_steps(self.last_soc) - soc_steps(soc_now)
 
         # If SoC is decreasing, we do the main efficiency calculation
-        if soc_now < self.last_soc:
+        if soc_used_steps >= SOC_EPS:
             self.is_charging = False
-            soc_used = self.last_soc - soc_now
+            soc_used = soc_used_steps / SOC_STEPS_PER_PERCENT
             miles_travelled = miles_now - self.last_miles
 
-            if miles_travelled == 0:
+            if odometer_steps(miles_now) - odometer_steps(self.last_miles) < MILES_EPS:
                 # The car didn't move, but SoC dropped => idle energy loss
                 self.idle_energy_loss_detected = True
             else:
                 self.idle_energy_loss_detected = False
                 if soc_used > 0:
-                    self._attr_state = round(miles_travelled / soc_used, 2)
+                    self._attr_native_value = round(miles_travelled / soc_used, 2)
 
             # Update reference points for next iteration
             self.last_miles = miles_now
             self.last_soc = soc_now
 
         # If SoC is increasing => charging or was plugged in. Just record new baseline.
-        elif soc_now > self.last_soc:
+        elif soc_used_steps <= -SOC_EPS:
             self.last_miles = miles_now
             self.last_soc = soc_now
             self.is_charging = True
 
-        # If soc_now == self.last_soc, no net change. Nothing to recalc.
-        return self._attr_state
+        # Smaller moves are jitter; keep the baseline so a slow drift still adds up.
 
-class IdleSoCLossSensor(SensorEntity, RestoreEntity):
+class IdleSoCLossSensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to track energy lost when the car is idle (SoC drops while odometer remains unchanged)."""
+    _attr_name = "EV Idle Energy Loss"
+    _attr_unique_id = "ev_idle_energy_loss"
+    _attr_native_unit_of_measurement = "%"
+
+    # Only a SoC change can be a loss; the odometer is read when it happens.
+    # The car stopping re-baselines separately (see _async_moving_changed).
+    TRACKED_ENTITIES = frozenset({
+        BATTERY_LEVEL_ENTITY,
+    })
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("last_soc", "last_miles")
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Idle Energy Loss"
-        self._attr_unique_id = "ev_idle_energy_loss"
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_state = 0  # Start tracking from zero
+        self._attr_native_value = 0  # Start tracking from zero
+        self._loss_x100 = 0  # Accumulated loss in hundredths of a percent, so it adds exactly
         self.last_soc = None
         self.last_miles = None
 
-        async_track_state_change_event(
-            hass,
-            ["sensor.myida_battery_level", "sensor.myida_odometer"],
-            self.async_update_callback
-        )
-
     async def async_added_to_hass(self):
         """Restore previous idle energy loss value after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
+        await self.async_restore_native_value()
+        self._loss_x100 = round(self._attr_native_value * 100)
+        self._attr_native_value = self._loss_x100 / 100
+
+        await self.async_restore_baselines()
+
+        self._async_track_inputs()
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass,
+                VEHICLE_MOVING_ENTITY,
+                self._async_moving_changed
+            )
+        )
 
-    async def async_update_callback(self, event):
-        """Triggered when SoC or odometer changes."""
-        entity_id = event.data.get("entity_id")
-        _LOGGER.debug("IDLELoss: State change event from %s. Scheduling efficiency update.", entity_id)
-        self.async_schedule_update_ha_state(force_refresh=True)
+    @callback
+    def _async_moving_changed(self, event):
+        """Re-baseline when the car stops, so the first SoC drop while parked is measured from where it parked."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state is None or new_state is None or old_state.state != "on" or new_state.state != "off":
+            return  # Only the moving → stopped edge matters
+
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY)
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY)
+        if soc_now is None or miles_now is None:
+            return  # Keep the old baseline; the next SoC event re-baselines if the car moved
 
-    @property
-    def state(self):
-        soc_now = get_float_state(self.hass, "sensor.myida_battery_level")
-        miles_now = get_float_state(self.hass, "sensor.myida_odometer")
+        # SoC used on the drive is not idle loss; nothing to write, the total is unchanged
+        self.last_soc = soc_now
+        self.last_miles = miles_now
+
+    def _update_state(self, event=None):
+        """Accumulate SoC lost while the odometer did not move."""
+        soc_now = get_float_state(self.hass, BATTERY_LEVEL_ENTITY, event)
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
 
         if soc_now is None or miles_now is None:
-            return self._attr_state  # Keep the last recorded idle loss if data is unavailable
+            return  # Keep the last recorded idle loss if data is unavailable
 
         if self.last_soc is None or self.last_miles is None:
             self.last_soc = soc_now
             self.last_miles = miles_now
-            return self._attr_state  
+            return  
+
+        soc_lost_steps = soc_steps(self.last_soc) - soc_steps(soc_now)
+        parked = abs(odometer_steps(miles_now) - odometer_steps(self.last_miles)) < MILES_EPS
+        if parked and abs(soc_lost_steps) < SOC_EPS:
+            # Jitter either way; keeping the baseline means a wobble is never counted
+            return
 
-        if soc_now < self.last_soc and miles_now == self.last_miles:
+        if parked and soc_lost_steps > 0:
             # SoC dropped, but odometer didn't increase → This is idle energy loss
-            soc_lost = self.last_soc - soc_now
-            self._attr_state += soc_lost  # Accumulate idle losses
+            self._loss_x100 += soc_lost_steps * 100 // SOC_STEPS_PER_PERCENT  # Accumulate idle losses
+            self._attr_native_value = self._loss_x100 / 100
 
         # Update last recorded values
         self.last_soc = soc_now
         self.last_miles = miles_now
-        return self._attr_state
 
-class HomeEnergyConsumptionPerChargeSensor(SensorEntity, RestoreEntity):
+class HomeEnergyConsumptionPerChargeSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
     """Sensor to track total energy consumed (kWh) per charge session (Home Charging Only)."""
+    _attr_name = "EV Home Energy Consumption Per Charge"
+    _attr_unique_id = "ev_home_energy_per_charge"
+    _attr_native_unit_of_measurement = "kWh"
+    _attr_suggested_display_precision = 2  # Rounded for display by the frontend
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        CHARGING_POWER_ENTITY,
+        CHARGING_ENTITY,
+        CABLE_CONNECTED_ENTITY,
+        PUBLIC_CHARGE_DETECTED_ENTITY,
+    })
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Home Energy Consumption Per Charge"
-        self._attr_unique_id = "ev_home_energy_per_charge"
-        self._attr_native_unit_of_measurement = "kWh"
-        self._attr_state = 0  # Start tracking from zero
+        self._attr_native_value = 0  # Start tracking from zero
         self.is_charging = False  # Flag to track if charging session is active
-        self.last_update = None  # Track last update time
+        self.last_update = None  # Time of the last power sample
+        self._last_power = None  # Last power sample (kW)
 
     async def async_added_to_hass(self):
         """Restore previous charge session energy consumption after a restart."""
         await super().async_added_to_hass()
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
-
-        # Register state change event listener without auto-removal
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            [
-                "sensor.myida_charging_power",
-                "switch.myida_charging",
-                "binary_sensor.myida_charging_cable_connected",
-                "binary_sensor.ev_public_charge_detected",
-            ],
-            self.async_update_callback,
-        )
-        
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
+        await self.async_restore_native_value()
+
+        self._async_track_inputs()
 
-    async def async_update_callback(self, event):
+    def _integrate_power(self, event):
+        """Add the energy drawn since the last power sample, held until this one."""
         entity_id = event.data.get("entity_id")
-        _LOGGER.debug("HomeECpChrg: State change event from %s. starting update.", entity_id)
-        """Triggered when charging power, charging state, cable connection, or public charge detection changes."""
-        now = datetime.utcnow()
-        if self.last_update:
-            time_delta = (now - self.last_update).total_seconds() / 3600  # Convert seconds to hours
-            charging_power = get_float_state(self.hass, "sensor.myida_charging_power")
-            if charging_power is not None and charging_power > 0:
-                self._attr_state += charging_power * time_delta  # kW * hours = kWh
-                self._attr_state = max(0, self._attr_state)  # Prevent negative values
-                self._attr_state = round(self._attr_state,2)
-                _LOGGER.debug("HomeECpChrg: Updated energy consumption: %s kWh", self._attr_state)
+        now = event.time_fired
+        if entity_id == CHARGING_POWER_ENTITY or self._last_power is None:
+            charging_power = get_float_state(self.hass, CHARGING_POWER_ENTITY, event)
+            if charging_power is not None:
+                charging_power = max(0.0, charging_power)  # Ignore negative readings
+        else:
+            # Power has not changed since the last sample; reuse the parsed value
+            charging_power = self._last_power
+        if charging_power is not None:
+            if self.last_update and self._last_power is not None:
+                energy_kwh = held_power_kwh(self.last_update, self._last_power, now)
+                if energy_kwh > 0:
+                    self._attr_native_value += energy_kwh
+                    _LOGGER.debug("HomeECpChrg: Updated energy consumption: %s kWh", self._attr_native_value)
         self.last_update = now
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
+        self._last_power = charging_power
 
-        charging_power = get_float_state(self.hass, "sensor.myida_charging_power")
-        charging_status = self.hass.states.get("switch.myida_charging")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.public_charging_detected")
+    def _update_state(self, event=None):
+        """Reset the session energy once the charge session has ended."""
+        if event is not None:
+            self._integrate_power(event)
+            charging_power = self._last_power  # Parsed by _integrate_power for this event
+        else:
+            charging_power = get_float_state(self.hass, CHARGING_POWER_ENTITY)
+        charging_status = get_state(self.hass, CHARGING_ENTITY, event)
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        public_charging = get_state(self.hass, PUBLIC_CHARGE_DETECTED_ENTITY, event)
 
         if charging_power is None or charging_status is None or cable_connected is None or public_charging is None:
-            self._attr_state = 0
+            self._attr_native_value = 0
 
             missing_inputs = []
             if charging_power is None:
-                missing_inputs.append("sensor.myida_charging_power")
+                missing_inputs.append(CHARGING_POWER_ENTITY)
             if charging_status is None:
-                missing_inputs.append("switch.myida_charging")
+                missing_inputs.append(CHARGING_ENTITY)
             if cable_connected is None:
-                missing_inputs.append("binary_sensor.myida_charging_cable_connected")
+                missing_inputs.append(CABLE_CONNECTED_ENTITY)
             if public_charging is None:
-                missing_inputs.append("binary_sensor.public_charging_detected")
+                missing_inputs.append(PUBLIC_CHARGE_DETECTED_ENTITY)
 
             _LOGGER.warning("HomeECpChrg: Missing required sensor inputs: %s", ", ".join(missing_inputs))
 
-            return round(self._attr_state, 2)  # Keep last recorded energy if data is unavailable
+            return  # Keep last recorded energy if data is unavailable
 
         charging = charging_status.state == "on"
         cable_plugged = cable_connected.state == "on"
         is_public_charging = public_charging.state == "on"
 
+        if not charging:
+            # Not charging: the next power sample starts a new integration interval
+            self.last_update = None
+            self._last_power = None
+
         if is_public_charging:
             # If public charging is detected, do not track home energy consumption
             _LOGGER.debug("HomeECpChrg: Public Charging Detected.")
-            return self._attr_state
+            return
 
         # if charging and cable_plugged:
         #     """Triggered when charging power, charging state, cable connection, or public charge detection changes."""
         #     _LOGGER.debug("HomeECpChrg: Cable Pluged and Charging on. Lets do the Kwh calculation.")
-        #     now = datetime.utcnow()
+        #     now = dt_util.utcnow()
         #     if self.last_update:
         #         time_delta = (now - self.last_update).total_seconds() / 3600  # Convert seconds to hours
         #         charging_power = get_float_state(self.hass, "sensor.myida_charging_power")
         #         if charging_power is not None and charging_power > 0:
-        #             self._attr_state += charging_power * time_delta  # kW * hours = kWh
-        #             self._attr_state = max(0, self._attr_state)  # Prevent negative values
-        #             self._attr_state = round(self._attr_state,2)
-        #             _LOGGER.debug("HomeECpChrg: Updated energy consumption: %s kWh", self._attr_state)
+        #             self._attr_native_value += charging_power * time_delta  # kW * hours = kWh
+        #             self._attr_native_value = max(0, self._attr_native_value)  # Prevent negative values
+        #             self._attr_native_value = round(self._attr_native_value,2)
+        #             _LOGGER.debug("HomeECpChrg: Updated energy consumption: %s kWh", self._attr_native_value)
         #     self.last_update = now
-        #     return round(self._attr_state,2)
+        #     return round(self._attr_native_value,2)
 
         # **RESET ENERGY TRACKING WHEN CHARGING SESSION ENDS**
         if not charging and not cable_plugged:
             #_LOGGER.debug("HomeECpChrg: Charging session ended. Resetting home energy consumption to 0.")
-            self._attr_state = 0
-            return round(self._attr_state,2)
-            
-        return round(self._attr_state,2)
+            self._attr_native_value = 0
 
-class AccumulateHomeEnergySensor(SensorEntity, RestoreEntity):
+class DeltaAccumulatorSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
     """
-    Accumulate home energy usage (in kWh) from sensor.ev_home_energy_per_charge.
+    Running total fed by another sensor of this integration.
 
-    Each time 'sensor.ev_home_energy_per_charge' changes, we calculate the difference
-    between old_state and new_state. If new_state is bigger, we add that difference
-    to our running total. This allows partial or incremental updates without double-counting.
+    Each time the source sensor changes, we calculate the difference between
+    old_state and new_state. If new_state is bigger, we add that difference to
+    our running total. This allows partial or incremental updates without double-counting.
+    Subclasses set the entity attributes, TRACKED_ENTITIES (the source) and LOG_PREFIX.
+    Money totals also set MINOR_UNITS so the sum is kept in integer pence.
     """
 
+    LOG_PREFIX = ""
+    MINOR_UNITS: int | None = None  # e.g. 100 pence per GBP; None keeps a float total
+
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "Total EV Home Energy"
-        self._attr_unique_id = "ev_accumulate_home_energy"
-        self._attr_native_unit_of_measurement = "kWh"
-        self._attr_state: float = 0.0
+        self._attr_native_value: float = 0.0  # Start tracking from zero
+        self._minor_total = 0  # Total in minor units when MINOR_UNITS is set
 
-        _LOGGER.debug("HomeToTECpChrg: Initializing AccumulateHomeEnergySensor")
-        
     async def async_added_to_hass(self):
         """Restore the previous total from the database on Home Assistant restart."""
         await super().async_added_to_hass()
-        old_state = await self.async_get_last_state()
-        if old_state and old_state.state not in ("unknown", "unavailable", None):
-            try:
-                self._attr_state = float(old_state.state)
-                _LOGGER.info("HomeToTECpChrg: Restored accumulated total: %s kWh", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("HomeToTECpChrg: Invalid stored total: %s", old_state.state)
-        # Watch for changes in sensor.ev_home_energy_per_charge
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            ["sensor.ev_home_energy_per_charge"],
-            self.async_energy_callback
-        )
-    
-    async def async_will_remove_from_hass(self):
-        """Called when entity is about to be removed."""
-        # Clean up your subscriptions if needed
-        if self._unsub:
-            self._unsub()
-            self._unsub = None
+        await self.async_restore_native_value()
+        if self.MINOR_UNITS:
+            self._minor_total = round(self._attr_native_value * self.MINOR_UNITS)
+            self._attr_native_value = self._minor_total / self.MINOR_UNITS
 
-    async def async_energy_callback(self, event):
-        """
-        Called whenever sensor.ev_home_energy_per_charge changes.
-        The event.data dict typically has "old_state" and "new_state".
-        """
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
+        """Add the increase of the source sensor to the total."""
+        if event is None:
+            return  # Only a change of the source is an increase
         old_state_obj = event.data.get("old_state")
         new_state_obj = event.data.get("new_state")
 
         if old_state_obj is None or new_state_obj is None:
             # We need both old & new to compute a difference.
             return
+        if old_state_obj.state in INVALID_STATES or new_state_obj.state in INVALID_STATES:
+            # Source unavailable (e.g. during startup); a recovery is not an increase
+            return
         old_val = float(old_state_obj.state)
         new_val = float(new_state_obj.state)
         diff = new_val - old_val
+        unit = self._attr_native_unit_of_measurement
 
         # If the sensor increments or jumps upward, accumulate the difference.
         if diff > 0:
-            self._attr_state += diff
+            if self.MINOR_UNITS:
+                # Whole pence add exactly, so the total does not drift over many sessions
+                self._minor_total += round(diff * self.MINOR_UNITS)
+                self._attr_native_value = self._minor_total / self.MINOR_UNITS
+            else:
+                self._attr_native_value += diff
             _LOGGER.debug(
-                "HomeToTECpChrg: Energy sensor changed from %.2f kWh to %.2f kWh → added %.2f kWh. New total: %.2f kWh",
-                old_val, new_val, diff, self._attr_state
+                "%s: Source changed from %.2f %s to %.2f %s → added %.2f %s. New total: %.2f %s",
+                self.LOG_PREFIX, old_val, unit, new_val, unit, diff, unit, self._attr_native_value, unit
             )
-            self.async_schedule_update_ha_state(force_refresh=True)
         else:
             # If new_val <= old_val, likely a reset or no net increase;
             # we do not subtract from the total or do anything else.
             _LOGGER.debug(
-                "HomeToTECpChrg: No net increase. Old=%.2f, New=%.2f; ignoring difference=%.2f",
-                old_val, new_val, diff
+                "%s: No net increase. Old=%.2f %s, New=%.2f %s; ignoring difference=%.2f %s",
+                self.LOG_PREFIX, old_val, unit, new_val, unit, diff, unit
             )
 
-    @property
-    def state(self) -> float:
-        """Return the accumulated total kWh."""
-        return round(self._attr_state, 2)
-
-class HomeChargeCostSensor(SensorEntity, RestoreEntity):
-    FIXED_RATE_GBP_PER_KWH = 0.07
+class AccumulateHomeEnergySensor(DeltaAccumulatorSensor):
+    """Accumulate home energy usage (in kWh) from sensor.ev_home_energy_per_charge."""
+    _attr_name = "Total EV Home Energy"
+    _attr_unique_id = "ev_accumulate_home_energy"
+    _attr_native_unit_of_measurement = "kWh"
+    _attr_suggested_display_precision = 2  # Rounded for display by the frontend
+
+    LOG_PREFIX = "HomeToTECpChrg"
+    TRACKED_ENTITIES = frozenset({
+        HOME_ENERGY_PER_CHARGE_ENTITY,
+    })
+
+class HomeChargeCostSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
+    _attr_name = "EV Home Charge Session Cost"
+    _attr_unique_id = "ev_home_charge_session_cost"
+    _attr_native_unit_of_measurement = "GBP"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        HOME_ENERGY_PER_CHARGE_ENTITY,
+        CHARGE_MODE_ENTITY,
+        CHARGING_ENTITY,
+        CABLE_CONNECTED_ENTITY,
+    })
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Home Charge Session Cost"
-        self._attr_unique_id = "ev_home_charge_session_cost"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state: float = 0.0
+        self._attr_native_value: float = 0.0
+        self._charge_mode = None  # Ohme charge mode, refreshed only when the mode entity fires
 
     async def async_added_to_hass(self):
         """When the entity is added to Home Assistant."""
         await super().async_added_to_hass()
 
-        # Restore previous state if available
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-                _LOGGER.info("HomeCostpChrg: Restored cost sensor: £%s", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("HomeCostpChrg: Could not parse restored cost: %s", last_state.state)
+        await self.async_restore_native_value()
 
         # Subscribe to state-change events for the given entities
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            [
-                "sensor.ev_home_energy_per_charge",
-                "select.ohme_epod_charge_mode",
-                "switch.myida_charging",
-                "binary_sensor.myida_charging_cable_connected",
-            ],
-            self.async_update_callback
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-            
-    async def async_update_callback(self, event):
-        entity_id = event.data.get("entity_id")
-        _LOGGER.debug("HomeCostpChrg: State change event for %s => recalc cost", entity_id)
-        self.async_schedule_update_ha_state(force_refresh=True)
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
+        """Recalculate the cost of the charge session."""
+        if event is None or event.data["entity_id"] == CHARGE_MODE_ENTITY:
+            mode_obj = get_state(self.hass, CHARGE_MODE_ENTITY, event)
+            if not mode_obj or mode_obj.state in INVALID_STATES:
+                self._charge_mode = None
+            else:
+                self._charge_mode = mode_obj.state
 
-    @property
-    def state(self):
-        """Calculate and return the cost of the charge session."""
-        
         # Get the charging status and cable connection state safely
-        charging_status = self.hass.states.get("switch.myida_charging")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
+        charging_status = get_state(self.hass, CHARGING_ENTITY, event)
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
 
         if charging_status is None or cable_connected is None:
             _LOGGER.warning("HomeCostpChrg: One or more required sensors are unavailable. Returning None.")
-            return self._attr_state  # Prevent crash if sensors are missing
+            return  # Prevent crash if sensors are missing
 
         charging = charging_status.state == "on"
         cable_plugged = cable_connected.state == "on"
@@ -766,25 +946,17 @@ class HomeChargeCostSensor(SensorEntity, RestoreEntity):
         if charging and cable_plugged:
 
             # Get energy consumption (ensure it's a float)
-            energy_kwh = get_float_state(self.hass, "sensor.ev_home_energy_per_charge")
+            energy_kwh = get_float_state(self.hass, HOME_ENERGY_PER_CHARGE_ENTITY, event)
             if energy_kwh is None:
                 _LOGGER.warning("HomeCostpChrg: Energy consumption sensor is unavailable. Returning None.")
-                return self._attr_state
+                return
 
-            # Get charging mode
-            mode_obj = self.hass.states.get("select.ohme_epod_charge_mode")
-            if not mode_obj or mode_obj.state in ("unknown", "unavailable"):
-                mode = None
+            mode = self._charge_mode
+            if mode is None:
                 _LOGGER.debug("HomeCostpChrg: Charging mode is unavailable.")
-            else:
-                mode = mode_obj.state
 
-            if mode == "smart_charge":
-                rate_gbp_per_kwh = self.FIXED_RATE_GBP_PER_KWH  # Assuming this is predefined
-                # Store the current rate for future use
-                self.last_rate_gbp_per_kwh = rate_gbp_per_kwh
-            elif mode == "max_charge":
-                rate_gbp_per_kwh = get_float_state(self.hass, "sensor.octopus_electricity_current_rate")
+            if mode in (CHARGE_MODE_SMART, CHARGE_MODE_MAX):
+                rate_gbp_per_kwh = get_home_charge_rate(self.hass, mode)
                 # Store the current rate for future use
                 self.last_rate_gbp_per_kwh = rate_gbp_per_kwh
             else:
@@ -793,160 +965,82 @@ class HomeChargeCostSensor(SensorEntity, RestoreEntity):
 
             if rate_gbp_per_kwh is None:
                 _LOGGER.warning("HomeCostpChrg: Electricity rate sensor is unavailable. Returning None.")
-                return self._attr_state  # Prevent crash when rate is missing
+                return  # Prevent crash when rate is missing
             cost = energy_kwh * rate_gbp_per_kwh
-            self._attr_state = round(cost, 2)
-            return self._attr_state
+            self._attr_native_value = round(cost, 2)
+            return
 
         if not charging and not cable_plugged:
             #_LOGGER.debug("HomeCostpChrg: Charging session ended. Resetting home energy consumption to 0")
-            self._attr_state = round(0,2)
-            return self._attr_state
+            self._attr_native_value = round(0,2)
+            return
 
         _LOGGER.debug(
             "HomeCostpChrg: Computed cost = %s ",)
 
-        return self._attr_state
-
-class TotalHomeChargingCostSensor(SensorEntity, RestoreEntity):
+class TotalHomeChargingCostSensor(DeltaAccumulatorSensor):
     """Sensor to track total accumulated home charging cost across multiple sessions."""
+    _attr_name = "Total Home Charging Cost"
+    _attr_unique_id = "ev_total_home_charge_cost"
+    _attr_native_unit_of_measurement = "GBP"
 
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
-        self._attr_name = "Total Home Charging Cost"
-        self._attr_unique_id = "ev_total_home_charge_cost"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state: float = 0.0  # Start tracking from zero
-        self.last_session_cost: float = 0.0  # Stores the last session cost
-
-    async def async_added_to_hass(self):
-        """Restore total home charging cost after a restart."""
-        await super().async_added_to_hass()
-        old_state = await self.async_get_last_state()
-        if old_state and old_state.state not in ("unknown", "unavailable", None):
-            try:
-                self._attr_state = float(old_state.state)
-                _LOGGER.info("HomeECToTCost: Restored accumulated total: %s £", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("HomeECToTCost: Invalid stored total: %s", old_state.state)
-        # Subscribe to state-change events for the given entities
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            [
-                "sensor.ev_home_charge_session_cost",
-            ],
-            self.async_update_callback
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-
-    async def async_update_callback(self, event):
-        """Triggered when a home charging session ends (cable unplugged or new cost is calculated)."""
-        old_state_obj = event.data.get("old_state")
-        new_state_obj = event.data.get("new_state")
-
-        if old_state_obj is None or new_state_obj is None:
-            # We need both old & new to compute a difference.
-            return
-        old_val = float(old_state_obj.state)
-        new_val = float(new_state_obj.state)
-        diff = new_val - old_val
+    LOG_PREFIX = "HomeECToTCost"
+    MINOR_UNITS = 100
+    TRACKED_ENTITIES = frozenset({
+        HOME_CHARGE_SESSION_COST_ENTITY,
+    })
 
-        # If the sensor increments or jumps upward, accumulate the difference.
-        if diff > 0:
-            self._attr_state += diff
-            _LOGGER.debug(
-                "HomeECToTCost: Home energy cost per session changed from %.2f £ to %.2f £ → added %.2f £. New total: %.2f £",
-                old_val, new_val, diff, self._attr_state
-            )
-            self.async_schedule_update_ha_state(force_refresh=True)
-        else:
-            # If new_val <= old_val, likely a reset or no net increase;
-            # we do not subtract from the total or do anything else.
-            _LOGGER.debug(
-                "HomeECToTCost: No net increase. Old=%.2f £, New=%.2f £; ignoring difference=%.2f £",
-                old_val, new_val, diff
-            )
-
-    @property
-    def state(self):
-        """Return the accumulated total kWh."""
-        return round(self._attr_state, 2)
-
-class HomeChargingSavingsPerSessionSensor(SensorEntity, RestoreEntity):
+class HomeChargingSavingsPerSessionSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
     """Sensor to calculate home charging savings per session compared to Octopus tariff."""
-    FIXED_RATE_GBP_PER_KWH = 0.07
+    _attr_name = "EV Home Charging Savings Per Session"
+    _attr_unique_id = "ev_home_charge_savings_per_session"
+    _attr_native_unit_of_measurement = "GBP"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        HOME_CHARGE_SESSION_COST_ENTITY,
+        HOME_ENERGY_PER_CHARGE_ENTITY,
+        CABLE_CONNECTED_ENTITY,
+        CHARGING_ENTITY,
+        PUBLIC_CHARGE_DETECTED_ENTITY,
+    })
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Home Charging Savings Per Session"
-        self._attr_unique_id = "ev_home_charge_savings_per_session"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state: float = 0.0  # Start tracking from zero
+        self._attr_native_value: float = 0.0  # Start tracking from zero
 
     async def async_added_to_hass(self):
-        # Restore previous state if available
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-                _LOGGER.info("HomeSvngpChrg: Restored cost sensor: £%s", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("HomeSvngpChrg: Could not parse restored cost: %s", last_state.state)
-
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            [
-                "sensor.ev_home_charge_session_cost", 
-                "sensor.ev_home_energy_per_charge",
-                "binary_sensor.myida_charging_cable_connected",
-                "switch.myida_charging",
-            ],
-            self.async_update_callback
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, event):
-        """Triggered when a home charging session ends."""
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
-        session_cost = get_float_state(self.hass, "sensor.ev_home_charge_session_cost")
-        session_energy = get_float_state(self.hass, "sensor.ev_home_energy_per_charge")
-        charging_status = self.hass.states.get("switch.myida_charging")
-        octopus_rate = get_float_state(self.hass, "sensor.octopus_electricity_current_rate")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.public_charging_detected")
+        await self.async_restore_native_value()
+
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
+        """Recalculate the savings of the current session."""
+        session_cost = get_float_state(self.hass, HOME_CHARGE_SESSION_COST_ENTITY, event)
+        session_energy = get_float_state(self.hass, HOME_ENERGY_PER_CHARGE_ENTITY, event)
+        charging_status = get_state(self.hass, CHARGING_ENTITY, event)
+        octopus_rate = get_float_state(self.hass, ELECTRICITY_RATE_ENTITY, event)
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        public_charging = get_state(self.hass, PUBLIC_CHARGE_DETECTED_ENTITY, event)
         
         if session_cost is None or session_energy is None or octopus_rate is None or public_charging is None or cable_connected is None or charging_status is None:
-            self._attr_state = 0
+            self._attr_native_value = 0
             missing_inputs = []
             if session_cost is None:
-                missing_inputs.append("sensor.ev_home_charge_session_cost")
+                missing_inputs.append(HOME_CHARGE_SESSION_COST_ENTITY)
             if session_energy is None:
-                missing_inputs.append("sensor.ev_home_energy_per_charge")
+                missing_inputs.append(HOME_ENERGY_PER_CHARGE_ENTITY)
             if octopus_rate is None:
-                missing_inputs.append("sensor.octopus_electricity_current_rate")
+                missing_inputs.append(ELECTRICITY_RATE_ENTITY)
             if cable_connected is None:
-                missing_inputs.append("binary_sensor.myida_charging_cable_connected")
+                missing_inputs.append(CABLE_CONNECTED_ENTITY)
             if public_charging is None:
-                missing_inputs.append("binary_sensor.public_charging_detected")
+                missing_inputs.append(PUBLIC_CHARGE_DETECTED_ENTITY)
             if charging_status is None:
-                missing_inputs.append("sswitch.myida_charging")
+                missing_inputs.append(CHARGING_ENTITY)
 
             _LOGGER.warning("HomeSvngpChrg: Missing required sensor inputs: %s", ", ".join(missing_inputs))
-            return round(self._attr_state, 2)  # Keep last recorded energy if data is unavailable
+            return  # Keep last recorded energy if data is unavailable
 
         charging = charging_status.state == "on"
         cable_plugged = cable_connected.state == "on"
@@ -955,191 +1049,96 @@ class HomeChargingSavingsPerSessionSensor(SensorEntity, RestoreEntity):
         if is_public_charging:
             # If public charging is detected, do not track home energy consumption
             _LOGGER.debug("HomeSvngpChrg: Public Charging Detected.")
-            self._attr_state = round(0, 2)
-            return self._attr_state
+            self._attr_native_value = round(0, 2)
+            return
 
         # Calculate what the cost *would* have been at the full Octopus tariff
         if charging and cable_plugged:
             normal_cost = session_energy * octopus_rate
             savings = normal_cost - session_cost  # Difference = savings
-            self._attr_state = round(savings, 2)
+            self._attr_native_value = round(savings, 2)
             _LOGGER.debug("HomeSvngpChrg: Calculating the savings and so far: %s.", savings)
-            return self._attr_state
+            return
 
         if not charging and not cable_connected:
             #_LOGGER.debug("HomeSvngpChrg: Charging session completed and reseting the cost to 0.")
-            self._attr_state = round(0, 2)
-            return self._attr_state   # Prevent crash if sensors are missing
-        
-        return self._attr_state
+            self._attr_native_value = round(0, 2)
 
-class TotalHomeChargingSavingsSensor(SensorEntity, RestoreEntity):
+class TotalHomeChargingSavingsSensor(DeltaAccumulatorSensor):
     """Sensor to track total accumulated home charging savings compared to Octopus tariff."""
+    _attr_name = "Total Home Charging Savings"
+    _attr_unique_id = "ev_total_home_charge_savings"
+    _attr_native_unit_of_measurement = "GBP"
 
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
-        self._attr_name = "Total Home Charging Savings"
-        self._attr_unique_id = "ev_total_home_charge_savings"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state: float = 0.0  # Start tracking from zero
-
-    async def async_added_to_hass(self):
-        """Restore total home charging cost after a restart."""
-        await super().async_added_to_hass()
-        old_state = await self.async_get_last_state()
-        if old_state and old_state.state not in ("unknown", "unavailable", None):
-            try:
-                self._attr_state = float(old_state.state)
-                _LOGGER.info("HomeSvgToTCost: Restored accumulated total: %s £", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("HomeSvgToTCost: Invalid stored total: %s", old_state.state)
-
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            [
-                "sensor.ev_home_charging_savings_per_session",
-            ],
-            self.async_update_callback
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-
-    async def async_update_callback(self, event):
-        """Triggered when a home charging session ends (cable unplugged or new cost is calculated)."""
-        old_state_obj = event.data.get("old_state")
-        new_state_obj = event.data.get("new_state")
-
-        if old_state_obj is None or new_state_obj is None:
-            # We need both old & new to compute a difference.
-            return
-        old_val = float(old_state_obj.state)
-        new_val = float(new_state_obj.state)
-        diff = new_val - old_val
+    LOG_PREFIX = "HomeSvgToTCost"
+    MINOR_UNITS = 100
+    TRACKED_ENTITIES = frozenset({
+        HOME_CHARGING_SAVINGS_ENTITY,
+    })
 
-        # If the sensor increments or jumps upward, accumulate the difference.
-        if diff > 0:
-            self._attr_state += diff
-            _LOGGER.debug(
-                "HomeSvgToTCost: Home energy cost per session changed from %.2f £ to %.2f £ → added %.2f £. New total: %.2f £",
-                old_val, new_val, diff, self._attr_state
-            )
-            self.async_schedule_update_ha_state(force_refresh=True)
-        else:
-            # If new_val <= old_val, likely a reset or no net increase;
-            # we do not subtract from the total or do anything else.
-            _LOGGER.debug(
-                "HomeSvgToTCost: No net increase. Old=%.2f £, New=%.2f £; ignoring difference=%.2f £",
-                old_val, new_val, diff
-            )
+class ChargeToChargeMilesPerKWhSensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
+    """Sensor to calculate Charge-to-Charge efficiency in miles/kWh based on previous charge cycle."""
+    _attr_name = "EV C2C Efficiency MipkWh"
+    _attr_unique_id = "ev_charge_to_charge_miles_per_kwh"
+    _attr_native_unit_of_measurement = "mi/kWh"
 
-    @property
-    def state(self):
-        """Return the accumulated total savings."""
-        return self._attr_state
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        CABLE_CONNECTED_ENTITY,
+        CHARGING_ENTITY,
+    })
 
-class ChargeToChargeMilesPerKWhSensor(SensorEntity, RestoreEntity):
-    """Sensor to calculate Charge-to-Charge efficiency in miles/kWh based on previous charge cycle."""
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("was_charging",)
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV C2C Efficiency MipkWh"
-        self._attr_unique_id = "ev_charge_to_charge_miles_per_kwh"
-        self._attr_native_unit_of_measurement = "mi/kWh"
-        self._attr_state: float = 0.0  # Efficiency starts as unknown
+        self._attr_native_value: float = 0.0  # Efficiency starts as unknown
         
         self.last_miles: float = 0.0
         self.last_kwh: float = 0.0
         self.was_charging = False
 
-    _LOGGER.info("C2C MilesPerKWh Effcny: Initializing ChargeToChargeEfficiencySensor")
-
-    def get_input_number_state(self, entity_id: str) -> float | None:
-        """Retrieve a float value from an input_number entity in Home Assistant."""
-        state = self.hass.states.get(entity_id)
-        if state and state.state not in (None, "unknown", "unavailable"):
-            try:
-                return float(state.state)
-            except ValueError:
-                _LOGGER.warning("C2C MilesPerKWh Effcny: Invalid value stored in %s: %s", entity_id, state.state)
-        return None
+        _LOGGER.info("C2C MilesPerKWh Effcny: Initializing ChargeToChargeMilesPerKWhSensor")
 
     async def async_added_to_hass(self):
         """Restore the last known efficiency value after a restart."""
         await super().async_added_to_hass()
 
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            try:
-                self._attr_state = float(last_state.state)
-                _LOGGER.info("C2C MilespKWh: Restored efficiency state: %s", self._attr_state)
-            except ValueError:
-                _LOGGER.warning("C2C MilesPerKWh Effcny: Stored state was invalid float: %s", last_state.state)
+        await self.async_restore_native_value()
 
         _LOGGER.debug("C2C MilesPerKWh Effcny: Restoring stored last_miles and last_kwh from input_numbers.")
 
-        _LOGGER.debug("C2C MilesPerKWh Effcny: Subscribe to state changes for: %s", [
-            "binary_sensor.myida_charging_cable_connected",
-            "switch.myida_charging",
-        ])
+        await self.async_restore_baselines()
 
-        # Subscribe to state changes using async_track_state_change_event.
-        self._unsub = async_track_state_change_event(
-            self.hass,
-            ["binary_sensor.myida_charging_cable_connected", "switch.myida_charging"],
-            self.async_update_callback
-        )
+        _LOGGER.debug("C2C MilesPerKWh Effcny: Subscribe to state changes for: %s", sorted(self.TRACKED_ENTITIES))
+
+        self._async_track_inputs()
 
     async def store_initial_values(self):
         """Store initial miles and SoC in Home Assistant input_number entities when charging starts."""
         # miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-        kwh_now = get_float_state(self.hass, "sensor.total_ev_home_energy")
+        kwh_now = get_float_state(self.hass, TOTAL_HOME_ENERGY_ENTITY)
 
         if kwh_now is not None:
             await self.hass.services.async_call(
                 "input_number", "set_value",
-                {"entity_id": "input_number.myida_c2c_start_kwh", "value": kwh_now},
+                {"entity_id": C2C_START_KWH_ENTITY, "value": kwh_now},
                 blocking=True
             )
             _LOGGER.info("C2C MilesPerKWh Effcny: Stored initial values: last_kwh=%s", kwh_now)
         else:
             _LOGGER.warning("C2C MilesPerKWh Effcny: Cannot store initial values: Odometer or Kwh sensor unavailable.")
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Cleanup when entity is about to be removed."""
-        if hasattr(self, "_unsub") and self._unsub:
-            self._unsub()
-            self._unsub = None
-
-    async def async_update_callback(self, event):
-        """Triggered whenever the cable sensor or charging switch changes."""
-        entity_id = event.data.get("entity_id")
-        old_state_obj = event.data.get("old_state")
-        new_state_obj = event.data.get("new_state")
-
-        old_state = old_state_obj.state if old_state_obj else None
-        new_state = new_state_obj.state if new_state_obj else None
-
-        _LOGGER.debug(
-            "C2C MilesPerKWh Effcny:: State change event for %s: %s → %s. Forcing sensor refresh.",
-            entity_id, old_state, new_state
-        )
-        # Force an immediate update of our sensor
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
-        """Calculate and return the charge-to-charge miles/kwh efficiency."""
-        cable_state = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        charging_state = self.hass.states.get("switch.myida_charging")
+    def _update_state(self, event=None):
+        """Recalculate the charge-to-charge miles/kwh efficiency."""
+        cable_state = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        charging_state = get_state(self.hass, CHARGING_ENTITY, event)
 
         if cable_state is None or charging_state is None:
             # Entities unavailable; keep the last known efficiency.
-            _LOGGER.debug("C2C MilesPerKWh Effcny: Input signals not available: %s", self._attr_state)
-            return self._attr_state
+            _LOGGER.debug("C2C MilesPerKWh Effcny: Input signals not available: %s", self._attr_native_value)
+            return
 
         cable_connected = (cable_state.state == "on")
         charging = (charging_state.state == "on")
@@ -1148,232 +1147,257 @@ class ChargeToChargeMilesPerKWhSensor(SensorEntity, RestoreEntity):
             # Charging started: Mark this session as "charging detected"
             # Reset charging flag since charging session is complete
             self.was_charging = True
-            return self._attr_state  # Keep updated efficiency value
+            return  # Keep updated efficiency value
 
         if not charging and not cable_connected and self.was_charging:
             # Cable unplugged after a successful charge → Calculate efficiency
-            miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-            kwh_now = get_float_state(self.hass, "sensor.total_ev_home_energy")
+            miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
+            kwh_now = get_float_state(self.hass, TOTAL_HOME_ENERGY_ENTITY, event)
             _LOGGER.debug("C2C MilesPerKWh Effcny: status of was_charging when EV charging finished: %s", self.was_charging)
 
             if miles_now is None or kwh_now is None:
                 _LOGGER.warning("C2C MilesPerKWh Effcny: Odometer or battery level sensor unavailable.")
-                return self._attr_state
+                return
 
             _LOGGER.debug("C2C MilesPerKWh Effcny: status of was_charging when EV charging started: %s", self.was_charging)
             if self.was_charging:
                 _LOGGER.debug("C2C MilesPerKWh Effcny: C2C Efficiency calcualtion started")
-                miles_now = get_float_state(self.hass, "sensor.myida_odometer")
+                miles_now = get_float_state(self.hass, ODOMETER_ENTITY, event)
                 _LOGGER.debug("C2C MilesPerKWh Effcny: C2C Efficiency calcualtion started miles_now: %s", miles_now)
-                kwh_now = get_float_state(self.hass, "sensor.total_ev_home_energy")
+                kwh_now = get_float_state(self.hass, TOTAL_HOME_ENERGY_ENTITY, event)
                 _LOGGER.debug("C2C MilesPerKWh Effcny: C2C Efficiency calcualtion started current kwh now: %s", kwh_now)
-                last_miles = self.get_input_number_state("input_number.myida_c2c_start_mile")
+                last_miles = get_input_number_state(self.hass, C2C_START_MILE_ENTITY)
                 _LOGGER.debug("C2C MilesPerKWh Effcny: C2C Efficiency calcualtion started last miles: %s", last_miles)
-                last_kwh = self.get_input_number_state("input_number.myida_c2c_start_kwh")
+                last_kwh = get_input_number_state(self.hass, C2C_START_KWH_ENTITY)
                 _LOGGER.debug("C2C MilesPerKWh Effcny: C2C Efficiency calcualtion started last soc: %s", last_kwh)
 
                 if None in (miles_now, kwh_now, last_miles, last_kwh):
                     _LOGGER.warning("C2C MilesPerKWh Effcny: Cannot calculate efficiency: Missing stored or current values.")
-                    return self._attr_state
+                    return
 
                 miles_travelled = miles_now - last_miles
                 kwh_used = last_kwh - kwh_now
 
                 if miles_travelled <= 0.1:  # Ensure the car actually moved
                     _LOGGER.warning("C2C MilesPerKWh Effcny: Drive cycle not detected (miles_travelled=%s). Skipping efficiency update.", miles_travelled)
-                    return self._attr_state  # Prevent invalid calculations
+                    return  # Prevent invalid calculations
 
                 if kwh_used > 0:
-                    self._attr_state = round(miles_travelled / kwh_used, 2)
-                    _LOGGER.info("C2C MilesPerKWh Effcny: Updated efficiency: %s mi/%% (miles=%s, kwh_used=%s)", self._attr_state, miles_travelled, kwh_used)
+                    self._attr_native_value = round(miles_travelled / kwh_used, 2)
+                    _LOGGER.info("C2C MilesPerKWh Effcny: Updated efficiency: %s mi/%% (miles=%s, kwh_used=%s)", self._attr_native_value, miles_travelled, kwh_used)
                     # Store new values for the next charge cycle
-                    self.hass.async_create_task(self.store_initial_values())
+                    self.hass.async_create_task(self.store_initial_values(), eager_start=True)
                     _LOGGER.info("C2C MilesPerKWh Effcny: One charging cycle complete and stored the current miles: %s and KWh: %s for next cycle", miles_now, kwh_now)
                     _LOGGER.debug("C2C MilesPerKWh Effcny: Charging session complete and start miles recorded as = %s mi", miles_now)
                     _LOGGER.debug("C2C MilesPerKWh Effcny: Charging session complete and start Kwh recorded as = %s KWh", kwh_now)
 
                 self.was_charging = False
-                return self._attr_state  # Updated efficiency value
-
-            return self._attr_state #Preserve previous value
 
-        return self._attr_state  # Keep last efficiency value until next valid charge cycle
-
-class PublicEnergyConsumptionPerSessionSensor(SensorEntity, RestoreEntity):
+class PublicEnergyConsumptionPerSessionSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
     """Sensor to track total energy consumed (kWh) per public charging session."""
+    _attr_name = "EV Public Energy Consumption Per Charge"
+    _attr_unique_id = "ev_public_energy_per_charge"
+    _attr_native_unit_of_measurement = "kWh"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        CHARGING_POWER_ENTITY,
+        CHARGING_ENTITY,
+        CABLE_CONNECTED_ENTITY,
+        PUBLIC_CHARGE_DETECTED_ENTITY,
+    })
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Public Energy Consumption Per Charge"
-        self._attr_unique_id = "ev_public_energy_per_charge"
-        self._attr_native_unit_of_measurement = "kWh"
-        self._attr_state = 0  # Start tracking from zero
+        self._attr_native_value = 0  # Start tracking from zero
         self.is_charging = False  # Track if a public charging session is active
-
-        async_track_state_change_event(
-            hass,
-            ["sensor.myida_charging_power", "switch.myida_charging", "binary_sensor.myida_charging_cable_connected", "binary_sensor.ev_public_charge_detected"],
-            self.async_update_callback
-        )
+        self.last_update = None  # Time of the last power sample while charging
+        self._last_power = None  # Last power sample (kW)
+        self._session_seq = 0  # Bumped when a session starts, so the total can tell sessions apart
+        self._attr_extra_state_attributes = {"session_seq": self._session_seq}
 
     async def async_added_to_hass(self):
         """Restore previous charge session energy consumption after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
+        last_state = await self.async_restore_native_value()
+        if last_state is not None:
+            self._session_seq = last_state.attributes.get("session_seq", 0)
+            self._attr_extra_state_attributes = {"session_seq": self._session_seq}
 
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, entity_id):
-        """Triggered when charging power, charging state, cable connection, or public charge detection changes."""
-        self.async_schedule_update_ha_state(force_refresh=True)
+        self._async_track_inputs()
 
-    @property
-    def state(self):
-        charging_power = get_float_state(self.hass, "sensor.myida_charging_power")
-        charging_status = self.hass.states.get("switch.myida_charging")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.ev_public_charge_detected")
+    def _update_state(self, event=None):
+        """Recalculate the energy of the current public session."""
+        charging_power = get_float_state(self.hass, CHARGING_POWER_ENTITY, event)
+        charging_status = get_state(self.hass, CHARGING_ENTITY, event)
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        public_charging = get_state(self.hass, PUBLIC_CHARGE_DETECTED_ENTITY, event)
 
         if charging_power is None or charging_status is None or cable_connected is None or public_charging is None:
-            return self._attr_state  # Keep last recorded energy if data is unavailable
+            return  # Keep last recorded energy if data is unavailable
 
         charging = charging_status.state == "on"
         cable_plugged = cable_connected.state == "on"
         is_public_charging = public_charging.state == "on"
 
         if not is_public_charging:
-            return self._attr_state  # Ignore energy if public charging is not detected
+            return  # Ignore energy if public charging is not detected
 
         if charging and cable_plugged:
+            if not self.is_charging:
+                # A new public session; published with the first energy written for it
+                self._session_seq += 1
+                self._attr_extra_state_attributes = {"session_seq": self._session_seq}
             self.is_charging = True
-            if charging_power > 0:
-                # Integrate energy consumption over time (assuming updates every 1 minute)
-                self._attr_state += charging_power * (1 / 60)  # Convert kW to kWh per minute
-        elif not cable_plugged and self.is_charging:
+            now = event.time_fired if event else dt_util.utcnow()
+            charging_power = max(0.0, charging_power)  # Ignore negative readings
+            if self.last_update and self._last_power is not None:
+                # Integrate over the actual interval since the previous power sample
+                self._attr_native_value += held_power_kwh(self.last_update, self._last_power, now)
+            self.last_update = now
+            self._last_power = charging_power
+            return
+
+        # Not charging: the next power sample starts a new integration interval
+        self.last_update = None
+        self._last_power = None
+
+        if not cable_plugged and self.is_charging:
             # Public charging session completed
             self.is_charging = False
-            return self._attr_state  # Keep the recorded kWh until the next session
+            return  # Keep the recorded kWh until the next session
 
         if not charging and not cable_plugged:
             # Reset energy tracking when a new public charging session starts
-            self._attr_state = 0
+            self._attr_native_value = 0
 
-        return self._attr_state
-
-class TotalPublicEnergyConsumptionSensor(SensorEntity, RestoreEntity):
+class TotalPublicEnergyConsumptionSensor(SensorEntity, _TrackedInputsMixin, FloatRestoreEntity):
     """Sensor to track total accumulated public charging energy consumption across multiple sessions."""
+    _attr_name = "Total Public Charging Energy Consumption"
+    _attr_unique_id = "ev_total_public_energy"
+    _attr_native_unit_of_measurement = "kWh"
+
+    # Only the cable moves the session phase; the other inputs are read at the session end
+    TRACKED_ENTITIES = frozenset({CABLE_CONNECTED_ENTITY})
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "Total Public Charging Energy Consumption"
-        self._attr_unique_id = "ev_total_public_energy"
-        self._attr_native_unit_of_measurement = "kWh"
-        self._attr_state = 0  # Start tracking from zero
-        self.last_session_energy = 0  # Stores the last session energy
-
-        async_track_state_change_event(
-            hass,
-            ["sensor.ev_public_energy_per_charge", "binary_sensor.ev_public_charge_detected", "binary_sensor.myida_charging_cable_connected"],
-            self.async_update_callback
-        )
+        self._attr_native_value = 0  # Start tracking from zero
+        self.last_session_seq = None  # Sequence number of the last session added
+        self._phase = PHASE_IDLE
 
     async def async_added_to_hass(self):
         """Restore total public energy consumption after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
+        await self.async_restore_native_value()
 
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, entity_id):
-        """Triggered when a public charging session ends (cable unplugged or energy per charge session updates)."""
-        self.async_schedule_update_ha_state(force_refresh=True)
+        self._async_track_inputs()
 
-    @property
-    def state(self):
-        session_energy = get_float_state(self.hass, "sensor.ev_public_energy_per_charge")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.ev_public_charge_detected")
+    def _update_state(self, event=None):
+        """Move the session phase on a cable change; add the session energy when the session ends."""
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        if cable_connected is None or cable_connected.state in INVALID_STATES:
+            return  # A car API dropout is not an unplug; only a real "off" ends the session
+        cable_plugged = cable_connected.state == "on"
+        if event is None or self._phase == PHASE_IDLE:
+            if cable_plugged:
+                self._phase = PHASE_ACTIVE  # Plugged in, or started mid-session
+            return
 
-        if session_energy is None or cable_connected is None or public_charging is None:
-            return self._attr_state  # Keep last recorded value if data is unavailable
+        if cable_plugged:
+            return  # Still plugged in; the session has not ended
 
-        cable_plugged = cable_connected.state == "on"
-        is_public_charging = public_charging.state == "on"
+        # active → idle: the only transition that can change the total
+        self._phase = PHASE_IDLE
+        self._add_finished_session()
 
-        if not is_public_charging:
-            return self._attr_state  # Ignore updates when public charging is not active
+    def _add_finished_session(self):
+        """Add the finished public session energy to the total."""
+        session = self.hass.states.get(PUBLIC_ENERGY_PER_CHARGE_ENTITY)
+        session_energy = get_float_state(self.hass, PUBLIC_ENERGY_PER_CHARGE_ENTITY)
+        public_charging = self.hass.states.get(PUBLIC_CHARGE_DETECTED_ENTITY)
 
-        if not cable_plugged and session_energy > 0 and session_energy != self.last_session_energy:
-            # A public charging session ended and the cable was unplugged → Add session energy to total
-            self._attr_state += session_energy
-            self.last_session_energy = session_energy  # Store last session value to prevent duplicate additions
+        if session_energy is None or public_charging is None:
+            return  # Keep last recorded value if data is unavailable
+
+        if public_charging.state != "on":
+            return  # The session that ended was not a public one
 
-        return self._attr_state
+        session_seq = session.attributes.get("session_seq")
+        if session_energy > 0 and session_seq != self.last_session_seq:
+            # A public charging session ended and the cable was unplugged → Add session energy to total
+            self._attr_native_value += session_energy
+            self.last_session_seq = session_seq  # Each session is added once, even if two match in kWh
 
-class PublicChargingCostPerSessionSensor(SensorEntity, RestoreEntity):
+class PublicChargingCostPerSessionSensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to calculate cost of public charging session with push notification for user input."""
+    _attr_name = "EV Public Charging Cost Per Session"
+    _attr_unique_id = "ev_public_charge_cost_per_session"
+    _attr_native_unit_of_measurement = "GBP"
+
+    # Entities whose state changes drive this sensor
+    TRACKED_ENTITIES = frozenset({
+        PUBLIC_ENERGY_PER_CHARGE_ENTITY,
+        PUBLIC_CHARGE_COST_PER_KWH_ENTITY,
+        CABLE_CONNECTED_ENTITY,
+        PUBLIC_CHARGE_DETECTED_ENTITY,
+    })
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("last_session_energy", "last_session_seq")
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "EV Public Charging Cost Per Session"
-        self._attr_unique_id = "ev_public_charge_cost_per_session"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state = 0  # Start tracking from zero
+        self._attr_native_value = 0  # Start tracking from zero
         self.last_session_energy = 0  # Stores the last session energy
-        self.hass = hass  # Home Assistant instance to send notifications
-
-        async_track_state_change_event(
-            hass,
-            ["sensor.ev_public_energy_per_charge", "input_number.ev_public_charge_cost_per_kwh", "binary_sensor.myida_charging_cable_connected", "binary_sensor.ev_public_charge_detected"],
-            self.async_update_callback
-        )
+        self.last_session_seq = None  # session_seq of the energy sensor's last latched session
+        self._attr_extra_state_attributes = {"session_seq": None}
 
     async def async_added_to_hass(self):
         """Restore cost value after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
+        last_state = await self.async_restore_native_value()
+        if last_state is not None:
+            self._attr_extra_state_attributes = {"session_seq": last_state.attributes.get("session_seq")}
 
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, entity_id):
-        """Triggered when energy per session, cost per kWh, or public charging status changes."""
-        self.async_schedule_update_ha_state(force_refresh=True)
+        await self.async_restore_baselines()
 
-    @property
-    def state(self):
-        session_energy = get_float_state(self.hass, "sensor.ev_public_energy_per_charge")
-        cost_per_kwh = get_float_state(self.hass, "input_number.ev_public_charge_cost_per_kwh")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.ev_public_charge_detected")
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
+        """Recalculate the cost of the last public session."""
+        session = get_state(self.hass, PUBLIC_ENERGY_PER_CHARGE_ENTITY, event)
+        session_energy = get_float_state(self.hass, PUBLIC_ENERGY_PER_CHARGE_ENTITY, event)
+        cost_per_kwh = get_float_state(self.hass, PUBLIC_CHARGE_COST_PER_KWH_ENTITY, event)
+        cable_connected = get_state(self.hass, CABLE_CONNECTED_ENTITY, event)
+        public_charging = get_state(self.hass, PUBLIC_CHARGE_DETECTED_ENTITY, event)
 
         if session_energy is None or cost_per_kwh is None or cable_connected is None or public_charging is None:
-            return self._attr_state  # Keep last recorded value if data is unavailable
+            return  # Keep last recorded value if data is unavailable
 
         cable_plugged = cable_connected.state == "on"
         is_public_charging = public_charging.state == "on"
+        session_seq = session.attributes.get("session_seq")
 
-        if not is_public_charging:
-            return self._attr_state  # Ignore updates when public charging is not active
-
-        if not cable_plugged and session_energy > 0 and session_energy != self.last_session_energy:
+        if (
+            is_public_charging
+            and not cable_plugged
+            and session_energy > 0
+            and session_seq != self.last_session_seq
+        ):
             # A public charging session ended, send push notification to user for cost input
             self.last_session_energy = session_energy  # Store session energy
-            self.hass.loop.create_task(self.send_push_notification(session_energy))  # Schedule async call
+            self.last_session_seq = session_seq  # Each session is latched once, even if two match in kWh
+            self.hass.async_create_task(self.send_push_notification(session_energy), eager_start=True)
 
         if self.last_session_energy > 0 and cost_per_kwh > 0:
-            # Calculate total cost when user inputs the cost per kWh
+            # Calculate total cost when user inputs the cost per kWh; the price usually
+            # arrives after the cable is unplugged, so this is not gated on public charging
             total_cost = self.last_session_energy * cost_per_kwh
-            self._attr_state = round(total_cost, 2)  # Store the cost of the last session
-
-        return self._attr_state
+            self._attr_native_value = round(total_cost, 2)  # Store the cost of the last session
+            # Published with the cost, so the total can tell which session the cost belongs to
+            self._attr_extra_state_attributes = {"session_seq": self.last_session_seq}
 
     async def send_push_notification(self, session_energy):
         """Send a push notification when a public charging session ends."""
-        message = (
-            f"Public Charging Session Ended 🚗⚡\n"
-            f"Energy Used: {session_energy:.2f} kWh\n"
-            "Please enter the cost per kWh in the Home Assistant app."
-        )
+        message = PUBLIC_CHARGE_NOTIFY_MESSAGE.format(session_energy=session_energy)
         await self.hass.services.async_call(
             "notify",
             "mobile_app_bharaths_iphone",
@@ -1382,144 +1406,138 @@ class PublicChargingCostPerSessionSensor(SensorEntity, RestoreEntity):
                 "message": message,
                 "data": {
                     "push": {
-                        "category": "input_number.ev_public_charge_cost_per_kwh"
+                        "category": PUBLIC_CHARGE_COST_PER_KWH_ENTITY
                     }
                 },
             },
         )
 
-class TotalPublicChargingCostSensor(SensorEntity, RestoreEntity):
+class TotalPublicChargingCostSensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to track total accumulated public charging cost across multiple sessions."""
+    _attr_name = "Total Public Charging Cost"
+    _attr_unique_id = "ev_total_public_charge_cost"
+    _attr_native_unit_of_measurement = "GBP"
+
+    # The session cost carries its session_seq, so it is the only input needed
+    TRACKED_ENTITIES = frozenset({
+        PUBLIC_CHARGE_COST_PER_SESSION_ENTITY,
+    })
+
+    # A new session_seq can arrive with an unchanged cost
+    TRACK_ATTRIBUTE_UPDATES = True
+
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("last_session_seq", "last_session_cost")
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "Total Public Charging Cost"
-        self._attr_unique_id = "ev_total_public_charge_cost"
-        self._attr_native_unit_of_measurement = "GBP"
-        self._attr_state = 0  # Start tracking from zero
-        self.last_session_cost = 0  # Stores the last session cost
-
-        async_track_state_change_event(
-            hass,
-            ["sensor.ev_public_charge_cost_per_session", "binary_sensor.ev_public_charge_detected", "binary_sensor.myida_charging_cable_connected"],
-            self.async_update_callback
-        )
+        self._attr_native_value = 0  # Start tracking from zero
+        self.last_session_seq = None  # session_seq of the last session added
+        self.last_session_cost = 0  # What that session contributed to the total
 
     async def async_added_to_hass(self):
         """Restore total public charging cost after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)
-
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, entity_id):
-        """Triggered when a public charging session ends (cable unplugged or new cost is calculated)."""
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
-        session_cost = get_float_state(self.hass, "sensor.ev_public_charge_cost_per_session")
-        cable_connected = self.hass.states.get("binary_sensor.myida_charging_cable_connected")
-        public_charging = self.hass.states.get("binary_sensor.ev_public_charge_detected")
-
-        if session_cost is None or cable_connected is None or public_charging is None:
-            return self._attr_state  # Keep last recorded value if data is unavailable
-
-        cable_plugged = cable_connected.state == "on"
-        is_public_charging = public_charging.state == "on"
-
-        if not is_public_charging:
-            return self._attr_state  # Ignore updates when public charging is not active
-
-        if not cable_plugged and session_cost > 0 and session_cost != self.last_session_cost:
-            # A public charging session ended and the cable was unplugged → Add session cost to total
-            self._attr_state += session_cost
-            self.last_session_cost = session_cost  # Store last session value to prevent duplicate additions
-
-        return self._attr_state
+        await self.async_restore_native_value()
+        await self.async_restore_baselines()
+
+        self._async_track_inputs()
+
+    def _update_state(self, event=None):
+        """Add the public session cost to the total, once per session."""
+        if event is None:
+            return  # No initial evaluation: the cost already shown was added before the restart
+        session = get_state(self.hass, PUBLIC_CHARGE_COST_PER_SESSION_ENTITY, event)
+        session_cost = get_float_state(self.hass, PUBLIC_CHARGE_COST_PER_SESSION_ENTITY, event)
+        if session_cost is None:
+            return  # Keep last recorded value if data is unavailable
+
+        session_seq = session.attributes.get("session_seq")
+        if session_seq is None or session_cost <= 0:
+            return  # No priced public session yet
+
+        if session_seq == self.last_session_seq:
+            # Same session re-priced (e.g. the user corrected the cost per kWh): replace its share
+            self._attr_native_value += session_cost - self.last_session_cost
+        else:
+            # A new session was priced → Add session cost to total
+            self._attr_native_value += session_cost
+        self._attr_native_value = round(self._attr_native_value, 2)
+        self.last_session_seq = session_seq
+        self.last_session_cost = session_cost
 
-class DriveToDriveMilesPerKWhSensor(SensorEntity, RestoreEntity):
+class DriveToDriveMilesPerKWhSensor(SensorEntity, _TrackedInputsMixin, BaselineRestoreEntity):
     """Sensor to calculate Drive-to-Drive efficiency in miles/kWh based on energy used while driving."""
+    _attr_name = "Drive-to-Drive Efficiency (Miles/kWh)"
+    _attr_unique_id = "ev_drive_to_drive_miles_per_kwh"
+    _attr_native_unit_of_measurement = "mi/kWh"
+
+    # Only the end of a drive changes the efficiency; odometer and SoC are read at that edge
+    TRACKED_ENTITIES = frozenset({VEHICLE_MOVING_ENTITY})
 
-    BATTERY_CAPACITY_KWH = 77  # Fixed battery capacity assumption
+    # Reference values kept across restarts
+    BASELINE_ATTRS = ("last_miles", "last_soc", "driving_detected")
 
     def __init__(self, hass: HomeAssistant):
         self.hass = hass
-        self._attr_name = "Drive-to-Drive Efficiency (Miles/kWh)"
-        self._attr_unique_id = "ev_drive_to_drive_miles_per_kwh"
-        self._attr_native_unit_of_measurement = "mi/kWh"
-        self._attr_state = "unknown"  # Proper initialization for numeric sensor
+        self._attr_native_value = None  # Unknown until the first drive is measured
         self.last_miles = None
         self.last_energy = None
         self.last_soc = None  # Track battery level for energy estimation
         self.driving_detected = False  # Track if an actual drive session happened
 
-        async_track_state_change_event(
-            hass,
-            ["sensor.myida_odometer", "sensor.myida_battery_level", "binary_sensor.myida_vehicle_moving"],
-            self.async_update_callback
-        )
-
     async def async_added_to_hass(self):
         """Restore efficiency after a restart."""
-        last_state = await self.async_get_last_state()
-        if last_state and last_state.state not in (None, "unknown", "unavailable"):
-            self._attr_state = float(last_state.state)  # Ensure restored state is a valid float
+        await self.async_restore_native_value()
 
-    #async def async_update_callback(self, entity_id, old_state, new_state):
-    async def async_update_callback(self, entity_id):
-        """Triggered when odometer, energy consumption, battery level, or driving state changes."""
-        self.async_schedule_update_ha_state(force_refresh=True)
-
-    @property
-    def state(self):
-        miles_now = get_float_state(self.hass, "sensor.myida_odometer")
-        #energy_used = get_float_state(self.hass, "sensor.myida_energy_used")  # Direct energy measurement
-        battery_level = get_float_state(self.hass, "sensor.myida_battery_level")
-        vehicle_moving = self.hass.states.get("binary_sensor.myida_vehicle_moving")
+        await self.async_restore_baselines()
 
-        if miles_now is None or battery_level is None or vehicle_moving is None:
-            return self._attr_state  # Keep last recorded efficiency if data is unavailable
+        self._async_track_inputs()
 
-        is_moving = vehicle_moving.state == "on"
+    def _update_state(self, event=None):
+        """Recalculate the efficiency once a drive has ended."""
+        vehicle_moving = get_state(self.hass, VEHICLE_MOVING_ENTITY, event)
+        if vehicle_moving is None or vehicle_moving.state in INVALID_STATES:
+            return  # Keep last recorded efficiency if data is unavailable
 
-        if is_moving:
+        if vehicle_moving.state == "on":
             # A new driving session has started
             self.driving_detected = True  # Track this drive session
-            return self._attr_state  # No update yet
-
-        if not is_moving and self.driving_detected:
-            # Car has stopped moving → Calculate efficiency from previous drive cycle
-            if self.last_miles is not None and self.last_energy is not None:
-                miles_travelled = miles_now - self.last_miles
-
-                #if energy_used is not None:
-                #    total_energy_used = energy_used  # Prefer direct measurement
-                #else:
-                # Estimate energy used from battery SoC drop
-                if self.last_soc is not None:
-                    soc_drop = self.last_soc - battery_level
-                    if soc_drop > 0:
-                        total_energy_used = (soc_drop / 100) * self.BATTERY_CAPACITY_KWH
-                    else:
-                        total_energy_used = None  # No valid energy change
-                else:
-                    total_energy_used = None
-
-                if total_energy_used is not None and total_energy_used > 0:
-                    efficiency = miles_travelled / total_energy_used
-                    self._attr_state = round(efficiency, 2)
-
-                    _LOGGER.info(
-                        f"Drive-to-Drive Efficiency Calculated: {miles_travelled:.2f} miles / {total_energy_used:.2f} kWh = {self._attr_state:.2f} mi/kWh"
-                    )
-                else:
-                    _LOGGER.warning("DriveToDriveMilesPerKWhSensor: No valid energy consumption detected.")
-
-            # Store new reference values for the next drive cycle
-            self.last_miles = miles_now
-            self.last_energy = total_energy_used
-            self.last_soc = battery_level
-            self.driving_detected = False  # Reset for the next valid drive cycle
+            return  # No update yet
+
+        if not self.driving_detected:
+            return  # Still parked; nothing to measure
+
+        # Car has stopped moving → Calculate efficiency from previous drive cycle
+        miles_now = get_float_state(self.hass, ODOMETER_ENTITY)
+        #energy_used = get_float_state(self.hass, "sensor.myida_energy_used")  # Direct energy measurement
+        battery_level = get_float_state(self.hass, BATTERY_LEVEL_ENTITY)
 
-        return self._attr_state
\ No newline at end of file
+        if miles_now is None or battery_level is None:
+            return  # Keep last recorded efficiency if data is unavailable
+
+        total_energy_used = None
+        if self.last_miles is not None and self.last_soc is not None:
+            miles_travelled = miles_now - self.last_miles
+
+            #if energy_used is not None:
+            #    total_energy_used = energy_used  # Prefer direct measurement
+            #else:
+            # Estimate energy used from battery SoC drop
+            total_energy_used = soc_drop_kwh(self.last_soc, battery_level)
+
+            if total_energy_used is not None:
+                efficiency = miles_travelled / total_energy_used
+                self._attr_native_value = round(efficiency, 2)
+
+                _LOGGER.info(
+                    "Drive-to-Drive Efficiency Calculated: %.2f miles / %.2f kWh = %.2f mi/kWh",
+                    miles_travelled, total_energy_used, self._attr_native_value
+                )
+            else:
+                _LOGGER.warning("DriveToDriveMilesPerKWhSensor: No valid energy consumption detected.")
+
+        # Store new reference values for the next drive cycle
+        self.last_miles = miles_now
+        self.last_energy = total_energy_used
+        self.last_soc = battery_level
+        self.driving_detected = False  # Reset for the next valid drive cycle